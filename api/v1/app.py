@@ -1,7 +1,8 @@
 #!/usr/bin/python3
 """app.py to connect to API"""
 import os
-from models import storage
+from models import storage, warm_up
+from models.passwords import Overloaded
 from api.v1.views import app_views
 from flask import Flask, Blueprint, jsonify, make_response
 from flask_cors import CORS
@@ -22,6 +23,15 @@ def teardown_appcontext(code):
 def page_not_found(error):
     return make_response(jsonify({'error': 'Not found'}), 404)
 
+
+@app.errorhandler(Overloaded)
+def overloaded(error):
+    """asks the client to retry when passwords cannot be hashed now"""
+    response = make_response(jsonify({'error': 'Overloaded'}), 503)
+    response.headers['Retry-After'] = '1'
+    return response
+
 if __name__ == "__main__":
+    warm_up()
     app.run(host=os.getenv('HBNB_API_HOST', '0.0.0.0'),
             port=int(os.getenv('HBNB_API_PORT', '5000')))
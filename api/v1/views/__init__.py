@@ -1,5 +1,20 @@
-from flask import Blueprint
+from flask import Blueprint, Response, json, stream_with_context
 app_views = Blueprint('app_views', __name__, url_prefix='/api/v1')
+
+
+def json_list(objs):
+    """returns a response streaming the JSON list of the dictionaries of
+    objs (e.g. storage.iter(cls)), so that it is never held in memory"""
+    def generate():
+        """yields the list one object at a time"""
+        yield "["
+        for i, obj in enumerate(objs):
+            yield (", " if i else "") + json.dumps(obj.to_dict())
+        yield "]\n"
+    return Response(stream_with_context(generate()),
+                    mimetype="application/json")
+
+
 from api.v1.views.index import *
 from api.v1.views.states import *
 from api.v1.views.cities import *
@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 """states.py"""
 
-from api.v1.views import app_views
+from api.v1.views import app_views, json_list
 from flask import abort, jsonify, make_response, request
 from models import storage
 from models.amenity import Amenity
@@ -10,10 +10,7 @@ from models.amenity import Amenity
 @app_views.route('/amenities', methods=['GET'], strict_slashes=False)
 def get_amenities():
     """get amenity information for all amenities"""
-    amenities = []
-    for amenity in storage.all("Amenity").values():
-        amenities.append(amenity.to_dict())
-    return jsonify(amenities)
+    return json_list(storage.iter("Amenity"))
 
 
 @app_views.route('/amenities/<string:amenity_id>', methods=['GET'],
@@ -62,5 +59,6 @@ def put_amenity(amenity_id):
     for attr, val in request.get_json().items():
         if attr not in ['id', 'created_at', 'updated_at']:
             setattr(amenity, attr, val)
-    amenity.save()
+    if amenity.dirty:
+        amenity.save()
     return jsonify(amenity.to_dict())
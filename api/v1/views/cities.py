@@ -82,5 +82,6 @@ def update_city(city_id):
     for key, value in data.items():
         if key != 'id' and key != 'created_at' and key != 'updated_at':
             setattr(city_obj, key, value)
-    city_obj.save()
+    if city_obj.dirty:
+        city_obj.save()
     return jsonify(city_obj.to_dict())
@@ -2,7 +2,7 @@
 """
 Module for methods used by app_view blueprint with Place class
 """
-from api.v1.views import app_views
+from api.v1.views import app_views, json_list
 from flask import jsonify, make_response, request, abort
 from models import storage
 from models.amenity import Amenity
@@ -78,7 +78,8 @@ def update_place(place_id):
         if (key != 'id' and key != 'created_at' and key != 'updated_at' and
                 key != 'user_id'):
             setattr(place_obj, key, value)
-    place_obj.save()
+    if place_obj.dirty:
+        place_obj.save()
     return jsonify(place_obj.to_dict())
 
 
@@ -91,27 +92,22 @@ def search_places():
     if type(data) is not dict:
         return make_response(jsonify({'error': 'Not a JSON'}), 400)
     if len(data) == 0:
-        list_places = [place.to_dict()
-                       for place in storage.all(Place).values()]
-        return jsonify(list_places)
+        return json_list(storage.iter(Place))
     len_states = len(data['states']) if 'states' in data else 0
     len_cities = len(data['cities']) if 'cities' in data else 0
     len_amenities = len(data['amenities']) if 'amenities' in data else 0
     if len_states == 0 and len_cities == 0 and len_amenities == 0:
-        list_places = [place.to_dict()
-                       for place in storage.all(Place).values()]
-        return jsonify(list_places)
+        return json_list(storage.iter(Place))
     list_states = []
     list_cities = []
     if len_states > 0:
-        for state_id in data['states']:
-            list_states.append(get_object(State, state_id))
+        list_states = get_objects(State, data['states'], 'places_search')
         for state in list_states:
             for city in state.cities:
                 list_cities.append(city)
     if len_cities > 0:
-        for city_id in data['cities']:
-            list_cities.append(get_object(City, city_id))
+        list_cities.extend(get_objects(City, data['cities'],
+                                       'places_search'))
     # print("this is list cities--------->>\n")
     # print(list_cities)
     list_cities = list(set(list_cities))
@@ -120,7 +116,7 @@ def search_places():
         for place in city.places:
             list_places.append(place)
     if len_states == 0 and len_cities == 0:
-        list_places = storage.all(Place).values()
+        list_places = storage.all(Place, profile='places_search').values()
     if (len_states > 0 or len_cities > 0) and len(list_places) == 0:
         return jsonify({})
     if len_amenities == 0:
@@ -139,14 +135,21 @@ def search_places():
                 checked = False
                 break
         if checked is True:
-            del(place.amenities)
-            places_in_search.append(get_object(Place, place.id))
+            places_in_search.append(place)
     result = [place.to_dict() for place in places_in_search]
     return jsonify(result)
 
 
-def get_object(cls, obj_id):
-    obj = storage.get(cls, obj_id)
+def get_object(cls, obj_id, profile=None):
+    obj = storage.get(cls, obj_id, profile=profile)
     if obj is None:
         abort(404)
     return obj
+
+
+def get_objects(cls, obj_ids, profile=None):
+    objs = storage.get_many(cls, obj_ids, profile=profile)
+    if any(type(obj_id) is not str or obj_id not in objs
+           for obj_id in obj_ids):
+        abort(404)
+    return list(objs.values())
@@ -35,7 +35,7 @@ def link_amenity_to_place(place_id, amenity_id):
         if amenity_id in place_obj.amenity_ids:
             return jsonify(amenity_obj.to_dict())
         else:
-            place_obj.amenity_ids.append(amenity_id)
+            place_obj.amenity_ids = place_obj.amenity_ids + [amenity_id]
     else:
         if amenity_obj in place_obj.amenities:
             return jsonify(amenity_obj.to_dict())
@@ -55,7 +55,8 @@ def delete_amenity_from_place(place_id, amenity_id):
     if environ.get('HBNB_TYPE_STORAGE') != 'db':
         if amenity_id not in place_obj.amenity_ids:
             abort(404)
-        place_obj.amenity_ids.remove(amenity_id)
+        place_obj.amenity_ids = [i for i in place_obj.amenity_ids
+                                 if i != amenity_id]
     else:
         if amenity_obj not in place_obj.amenities:
             abort(404)
@@ -76,7 +76,8 @@ def update_review(review_id):
         if (key != 'id' and key != 'created_at' and key != 'updated_at' and
                 key != 'user_id'):
             setattr(review_obj, key, value)
-    review_obj.save()
+    if review_obj.dirty:
+        review_obj.save()
     return jsonify(review_obj.to_dict())
 
 
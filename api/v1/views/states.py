@@ -2,7 +2,7 @@
 """
 Module for methods used by app_view blueprint
 """
-from api.v1.views import app_views
+from api.v1.views import app_views, json_list
 from flask import jsonify, make_response, request, abort
 from models import storage
 from models.state import State
@@ -13,9 +13,7 @@ from flasgger import swag_from
 @swag_from('swagger_spec/get_states.yml')
 def get_states():
     """Retrieves the list of all State objects"""
-    state_list = list(storage.all(State).values())
-    state_dict = [state.to_dict() for state in state_list]
-    return jsonify(state_dict)
+    return json_list(storage.iter(State))
 
 
 @app_views.route('/states/<state_id>', methods=['GET'], strict_slashes=False)
@@ -71,5 +69,6 @@ def update_state(state_id):
     for key, value in data.items():
         if key != 'id' and key != 'created_at' and key != 'updated_at':
             setattr(state_obj, key, value)
-    state_obj.save()
+    if state_obj.dirty:
+        state_obj.save()
     return jsonify(state_obj.to_dict())
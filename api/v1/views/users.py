@@ -2,11 +2,10 @@
 """
 Module for methods used by app_view blueprint
 """
-from api.v1.views import app_views
+from api.v1.views import app_views, json_list
 from flask import jsonify, make_response, request, abort
 from models import storage
 from models.user import User
-import hashlib
 from flasgger import swag_from
 
 
@@ -15,9 +14,7 @@ from flasgger import swag_from
 @swag_from('swagger_spec/get_users.yml')
 def get_users():
     """Retrieves the list of all User objects"""
-    user_list = list(storage.all(User).values())
-    user_dict = [user.to_dict() for user in user_list]
-    return jsonify(user_dict)
+    return json_list(storage.iter(User))
 
 
 @app_views.route('/users/<user_id>', methods=['GET'],
@@ -47,12 +44,6 @@ def create_user():
         if key == 'id' and key == 'created_at' and key == 'updated_at':
             del data[key]
     new_obj = User(**data)
-    #     if key == 'password':
-    #         pw = value
-    #         encoding = 'utf-8'
-    #         pw_hashed = hashlib.md5(pw.encode(encoding)).hexdigest()
-    #         setattr(new_obj, key, pw_hashed)
-
     new_obj.save()
     return make_response(jsonify(new_obj.to_dict()), 201)
 
@@ -81,14 +72,12 @@ def update_user(user_id):
     data = request.get_json()
     if type(data) is not dict:
         return make_response(jsonify({'error': 'Not a JSON'}), 400)
+    password = data.pop('password', None)
+    if password is not None:
+        user_obj.password = password
     for key, value in data.items():
         if key != 'id' and key != 'created_at' and key != 'updated_at':
             setattr(user_obj, key, value)
-        if key == 'password':
-            pw = value
-            encoding = 'utf-8'
-            pw_hashed = hashlib.md5(pw.encode(encoding)).hexdigest()
-            setattr(user_obj, key, pw_hashed)
-
-    user_obj.save()
+    if user_obj.dirty:
+        user_obj.save()
     return jsonify(user_obj.to_dict())
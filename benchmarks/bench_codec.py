@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""
+Times FileStorage.save() and reload() of generated reviews with each
+snapshot codec of models.engine.codec
+
+Usage: ./benchmarks/bench_codec.py [count ...]
+Each count (10^5 and 10^6 by default) is saved, then reloaded, by a new
+process per codec, in a temporary directory.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+save = """
+import sys
+import time
+sys.path.insert(0, {root!r})
+import models
+from models.review import Review
+storage = models.warm_up()
+storage.new_many(Review.from_dicts(
+    {{"place_id": "p" + str(i % 20000), "user_id": "u" + str(i % 5000),
+      "text": "Great"}} for i in range({count:d})))
+start = time.perf_counter()
+storage.save()
+print(time.perf_counter() - start)
+"""
+
+reload = """
+import sys
+import time
+sys.path.insert(0, {root!r})
+import models
+start = time.perf_counter()
+models.warm_up()
+print(time.perf_counter() - start)
+"""
+
+
+def run(code, data, codec):
+    """returns the seconds code printed, run by a new process in data"""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("HBNB_")}
+    env["HBNB_FILE_FORMAT"] = codec
+    out = subprocess.run([sys.executable, "-c", code], cwd=data, env=env,
+                         stdout=subprocess.PIPE, check=True).stdout
+    return float(out)
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, root)
+    from models.engine.codec import codecs
+    counts = [int(n) for n in sys.argv[1:]] or [10 ** 5, 10 ** 6]
+    print("{:>10} {:>7} {:>9} {:>9} {:>9} {:>13}".format(
+        "objects", "codec", "save", "reload", "MB", "vs json"))
+    for count in counts:
+        times = {}
+        for name, codec in codecs.items():
+            with tempfile.TemporaryDirectory() as data:
+                saved = run(save.format(root=root, count=count), data, name)
+                size = os.path.getsize(os.path.join(
+                    data, "file" + codec.extension))
+                loaded = run(reload.format(root=root), data, name)
+            times[name] = (saved, loaded)
+            row = "{:>10} {:>7} {:>8.2f}s {:>8.2f}s {:>9.1f} {:>5.1f}x" \
+                " {:>5.1f}x"
+            print(row.format(count, name, saved, loaded, size / 1e6,
+                             times["json"][0] / saved,
+                             times["json"][1] / loaded))
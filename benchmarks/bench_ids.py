@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+"""
+Times bulk inserts of places and reviews with each id scheme of models.ids
+
+Usage: ./benchmarks/bench_ids.py [count] [database URL]
+count places, then count reviews, are inserted in batches of 1000 into
+freshly created tables, once per scheme, under real parent state, city,
+user and place rows so that foreign key checks pass. The URL defaults
+to a SQLite file in a temporary directory; pass a mysql+mysqldb:// URL
+to measure InnoDB.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+
+def insert(engine, cls, count, fields):
+    """returns the seconds taken to insert count objects of cls"""
+    from sqlalchemy.orm import Session
+    start = time.perf_counter()
+    with Session(engine) as session:
+        for first in range(0, count, 1000):
+            session.add_all(cls(**fields) for i in range(
+                first, min(first + 1000, count)))
+            session.commit()
+    return time.perf_counter() - start
+
+
+def parents(engine):
+    """returns the ids of a city, a user and a place to insert under"""
+    from models.city import City
+    from models.place import Place
+    from models.state import State
+    from models.user import User
+    from sqlalchemy.orm import Session
+    with Session(engine) as session:
+        state = State(name="California")
+        city = City(state_id=state.id, name="Fresno")
+        user = User(email="bench@hbnb.io", password="bench")
+        place = Place(city_id=city.id, user_id=user.id, name="Home")
+        for obj in (state, city, user, place):
+            session.add(obj)
+            session.flush()
+        session.commit()
+        return city.id, user.id, place.id
+
+
+def run(url, count, scheme):
+    """returns the place and review insert times with the id scheme"""
+    from models import ids
+    from models.base_model import Base
+    from models.place import Place
+    from models.review import Review
+    from sqlalchemy import create_engine
+    ids.new_id = ids.generators[scheme]
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    try:
+        city_id, user_id, place_id = parents(engine)
+        places = insert(engine, Place, count, {
+            "city_id": city_id, "user_id": user_id, "name": "Loft"})
+        reviews = insert(engine, Review, count, {
+            "place_id": place_id, "user_id": user_id, "text": "Good"})
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+    return places, reviews
+
+
+if __name__ == "__main__":
+    os.environ["HBNB_TYPE_STORAGE"] = "db"
+    sys.path.insert(0, os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    from models import ids
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        url = sys.argv[2] if len(sys.argv) > 2 else \
+            "sqlite:///" + os.path.join(tmp, "bench.db")
+        print("{:>7} {:>10} {:>14} {:>14}"
+              .format("scheme", "objects", "places/s", "reviews/s"))
+        for scheme in ids.generators:
+            places, reviews = run(url, count, scheme)
+            print("{:>7} {:>10} {:>14.0f} {:>14.0f}"
+                  .format(scheme, count, count / places, count / reviews))
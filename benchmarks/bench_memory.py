@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""
+Measures the memory FileStorage.reload() of generated reviews takes: the
+peak and steady resident memory of the process, and what the objects
+cost once loaded
+
+Usage: ./benchmarks/bench_memory.py [--against <checkout>]
+                                    [--max-bytes <n>] [count ...]
+Each count (10^5 by default) is loaded in a new process from a file.json
+written in a temporary directory; what the objects cost is the steady
+memory of that process less that of one loading an empty file.json.
+--against loads it with the models of another checkout too (e.g. a git
+worktree of an earlier commit, which may load at import), and
+--max-bytes exits with status 1 if an object costs more than n bytes.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from bench_reload import generate
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+child = """
+import os
+import resource
+import sys
+sys.path.insert(0, {root!r})
+os.chdir({data!r})
+import models
+if hasattr(models, "warm_up"):
+    models.warm_up()
+models.storage.count()
+with open("/proc/self/statm") as f:
+    rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024, rss)
+"""
+
+
+def measure(tree, data):
+    """returns the peak and steady resident memory, in bytes, of a new
+    process reloading data's file.json with the models of tree"""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("HBNB_")}
+    with tempfile.TemporaryDirectory() as empty:
+        out = subprocess.run([sys.executable, "-c",
+                              child.format(root=tree, data=data)],
+                             cwd=empty, env=env, stdout=subprocess.PIPE,
+                             check=True).stdout
+    return [int(n) for n in out.split()]
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    trees = [("this", root)]
+    limit = None
+    while args and args[0] in ("--against", "--max-bytes"):
+        if args[0] == "--against":
+            trees.append(("against", os.path.abspath(args[1])))
+        else:
+            limit = int(args[1])
+        args = args[2:]
+    counts = [int(n) for n in args] or [10 ** 5]
+    empty = tempfile.TemporaryDirectory()
+    generate(os.path.join(empty.name, "file.json"), 0)
+    bare = {name: measure(tree, empty.name)[1] for name, tree in trees}
+    print("{:>10} {:>8} {:>10} {:>10} {:>10} {:>10}".format(
+        "objects", "tree", "peak MB", "steady MB", "loaded MB", "B/object"))
+    over = False
+    for count in counts:
+        with tempfile.TemporaryDirectory() as data:
+            generate(os.path.join(data, "file.json"), count)
+            for name, tree in trees:
+                peak, steady = measure(tree, data)
+                loaded = steady - bare[name]
+                print("{:>10} {:>8} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.0f}"
+                      .format(count, name, peak / 1e6, steady / 1e6,
+                              loaded / 1e6, loaded / count))
+                if name == "this" and limit is not None:
+                    over = over or loaded / count > limit
+    empty.cleanup()
+    sys.exit(1 if over else 0)
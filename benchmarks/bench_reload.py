@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""
+Times FileStorage.reload() of generated reviews, parsing their dates with
+models.base_model.parse_time and with datetime.strptime as it used to
+
+Usage: ./benchmarks/bench_reload.py [count ...]
+Each count (10^5 and 10^6 by default) is loaded in a new process per
+parser, from a file.json written in a temporary directory.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import uuid
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+child = """
+import os
+import sys
+import time
+sys.path.insert(0, {root!r})
+import models
+from models import base_model
+from datetime import datetime
+if {strptime!r}:
+    base_model.parse_time = \\
+        lambda value: datetime.strptime(value, base_model.time)
+os.chdir({data!r})
+start = time.perf_counter()
+models.warm_up()
+print(time.perf_counter() - start)
+"""
+
+
+def generate(path, count):
+    """writes a file.json of count reviews to path, one record at a time"""
+    with open(path, 'w') as f:
+        f.write("{")
+        for i in range(count):
+            id = str(uuid.uuid4())
+            record = {"id": id, "__class__": "Review",
+                      "created_at": "2017-03-25T02:17:06.000000",
+                      "updated_at": "2017-03-25T02:17:06.{:06d}"
+                      .format(i % 1000000),
+                      "place_id": "p", "user_id": "u", "text": "Great"}
+            f.write("{}{}: {}".format(", " if i else "",
+                                      json.dumps("Review." + id),
+                                      json.dumps(record)))
+        f.write("}")
+
+
+def reload_time(data, strptime):
+    """returns the seconds a new process takes to reload data's file.json"""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("HBNB_")}
+    with tempfile.TemporaryDirectory() as empty:
+        out = subprocess.run([sys.executable, "-c",
+                              child.format(root=root, strptime=strptime,
+                                           data=data)],
+                             cwd=empty, env=env, stdout=subprocess.PIPE,
+                             check=True).stdout
+    return float(out)
+
+
+if __name__ == "__main__":
+    counts = [int(n) for n in sys.argv[1:]] or [10 ** 5, 10 ** 6]
+    print("{:>10} {:>12} {:>12} {:>8}"
+          .format("objects", "strptime", "parse_time", "speedup"))
+    for count in counts:
+        with tempfile.TemporaryDirectory() as data:
+            generate(os.path.join(data, "file.json"), count)
+            slow = reload_time(data, True)
+            fast = reload_time(data, False)
+        print("{:>10} {:>11.2f}s {:>11.2f}s {:>7.2f}x".format(
+            count, slow, fast, slow / fast))
@@ -1,17 +1,38 @@
 #!/usr/bin/python3
 """
 initialize the models package
+
+models.storage is created and loaded on first use rather than at import:
+until then it is a LazyStorage, replaced by the engine itself once
+created. Servers call warm_up() to load it before taking requests.
 """
 
 from os import getenv
+from models.engine.lazy_storage import LazyStorage
 
 
 storage_t = getenv("HBNB_TYPE_STORAGE")
 
 if storage_t == "db":
-    from models.engine.db_storage import DBStorage
-    storage = DBStorage()
+    from models.engine.db_storage import DBStorage as Storage
 else:
-    from models.engine.file_storage import FileStorage
-    storage = FileStorage()
-storage.reload()
+    from models.engine.file_storage import FileStorage as Storage
+
+
+def create_storage():
+    """creates and reloads the storage engine, and binds it to storage"""
+    global storage
+    engine = Storage()
+    engine.reload()
+    storage = engine
+    return engine
+
+
+def warm_up():
+    """creates and loads the storage engine now and returns it"""
+    if isinstance(storage, LazyStorage):
+        return storage.engine()
+    return storage
+
+
+storage = LazyStorage(create_storage)
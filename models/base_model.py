@@ -5,48 +5,302 @@ Contains class BaseModel
 
 from datetime import datetime
 import models
+from models import ids
+from models.intern import references
 from os import getenv
 import sqlalchemy
 from sqlalchemy import Column, String, DateTime
 from sqlalchemy.ext.declarative import declarative_base
-import uuid
 
 time = "%Y-%m-%dT%H:%M:%S.%f"
+dates = ("created_at", "updated_at")
+suffixes = ("_id", "_ids")
+missing = object()
+# the slots to_dict() never lists, which setting leaves its cache alone
+unlisted = ("_BaseModel__changed", "_BaseModel__serialized")
+
+
+def parse_time(value):
+    """returns the datetime of a string written with the time format
+
+    Strings of the exact length that format produces go through
+    datetime.fromisoformat, several times faster than strptime, which
+    still parses the others (e.g. fewer microsecond digits).
+    """
+    if len(value) == 26:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, time)
+
 
 if models.storage_t == "db":
     Base = declarative_base()
 else:
     Base = object
 
+slotted = models.storage_t != "db" and bool(getenv("HBNB_MODEL_SLOTS"))
+
+
+class Slotted(type):
+    """metaclass storing the attributes of instances in fixed slots
+
+    The plain values a class body assigns (the file mode defaults such as
+    name = "") become slots of the class, and the values themselves move
+    to _defaults, where instances whose slot is unset read them from.
+    _fields lists the slots of the class and of its bases.
+    """
 
-class BaseModel:
-    """The BaseModel class from which future classes will be derived"""
+    def __new__(mcs, name, bases, namespace):
+        """creates the class, turning its default values into slots"""
+        fields = [k for k, v in namespace.items()
+                  if not k.startswith("_") and not hasattr(v, "__get__")]
+        defaults = {}
+        inherited = []
+        for base in reversed(bases):
+            defaults.update(getattr(base, "_defaults", {}))
+            inherited += getattr(base, "_fields", ())
+        for field in fields:
+            defaults[field] = namespace.pop(field)
+        slots = tuple(namespace.get("__slots__", ())) + tuple(fields)
+        namespace["_defaults"] = defaults
+        namespace["_fields"] = tuple(inherited) + \
+            tuple(s for s in slots if not s.startswith("__"))
+        namespace["__slots__"] = slots
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class BaseModel(metaclass=Slotted if slotted else type):
+    """The BaseModel class from which future classes will be derived
+
+    to_dict() keeps the dict it returns by default in __serialized, with
+    the updated_at it was built for, and returns copies of it until an
+    attribute is set or deleted, or updated_at is replaced.
+
+    The ids held by reference attributes (_references: the attributes of
+    the class whose name ends with _id, or _ids for lists) are interned
+    in models.intern.references however they are set, so that objects
+    referring to the same object share one copy of its id. Setting one
+    then calls _moved with the instance, if set: the file storage engine
+    sets it to keep its indexes of those ids up to date.
+
+    Instances track their changes: __changed is True until the instance
+    is first stored, then the set of the public attributes whose value
+    changed since it was last stored, or None when there are none. It is
+    a slot, so that it stays out of __dict__, and storage engines call
+    clean() once they persisted the instance.
+
+    With HBNB_MODEL_SLOTS=1 in file mode, instances have no __dict__:
+    the id, dates and class defaults live in slots, and any other
+    attribute in an overflow dict only created when one is set. The
+    __dict__ property then returns a new dict of the attributes set.
+    """
+    _plain_init = True
+    _references = frozenset()
+    _moved = None
     if models.storage_t == "db":
         id = Column(String(60), primary_key=True)
         created_at = Column(DateTime, default=datetime.utcnow)
         updated_at = Column(DateTime, default=datetime.utcnow)
+    if slotted:
+        __slots__ = ("id", "created_at", "updated_at", "__changed",
+                     "__serialized", "__extra")
+
+        def __getattr__(self, name):
+            """returns the ad-hoc attribute or class default called name"""
+            if not name.startswith("_BaseModel__"):
+                try:
+                    return self.__extra[name]
+                except (AttributeError, KeyError):
+                    pass
+                if name in self._defaults:
+                    return self._defaults[name]
+            raise AttributeError("'{}' object has no attribute '{}'"
+                                 .format(self.__class__.__name__, name))
+
+        def __store(self, name, value):
+            """sets name in its slot, or in the overflow dict"""
+            if hasattr(type(self), name):
+                object.__setattr__(self, name, value)
+                return
+            try:
+                extra = self.__extra
+            except AttributeError:
+                extra = self.__extra = {}
+            extra[name] = value
+
+        def __remove(self, name):
+            """deletes name from its slot, or from the overflow dict"""
+            if hasattr(type(self), name):
+                object.__delattr__(self, name)
+                return
+            try:
+                del self.__extra[name]
+            except (AttributeError, KeyError):
+                raise AttributeError(name)
+
+        @property
+        def __dict__(self):
+            """returns a new dict of the attributes set on the instance"""
+            attrs = {}
+            for name in self._fields:
+                try:
+                    attrs[name] = object.__getattribute__(self, name)
+                except AttributeError:
+                    pass
+            try:
+                attrs.update(self.__extra)
+            except AttributeError:
+                pass
+            return attrs
+    else:
+        __slots__ = ("__changed", "__serialized", "__dict__", "__weakref__")
+
+        __store = object.__setattr__
+        __remove = object.__delattr__
+
+    def __setattr__(self, name, value):
+        """sets an attribute, recording public ones whose value changes"""
+        try:
+            changed = self.__changed
+        except AttributeError:
+            changed = None
+        if name not in unlisted:
+            object.__setattr__(self, "_BaseModel__serialized", None)
+        if name[0] == "_":
+            self.__store(name, value)
+            return
+        moved = None
+        if name in self._references:
+            value = references.intern(value)
+            moved = self._moved
+        if changed is True:
+            self.__store(name, value)
+        else:
+            old = getattr(self, name, missing)
+            self.__store(name, value)
+            if old is not value and old != value:
+                if changed is None:
+                    self.__changed = {name}
+                else:
+                    changed.add(name)
+        if moved is not None:
+            moved(self)
+
+    def __delattr__(self, name):
+        """deletes an attribute, dropping the dict to_dict() keeps"""
+        object.__setattr__(self, "_BaseModel__serialized", None)
+        self.__remove(name)
+
+    def __state(self):
+        """returns __changed, None if it was never set"""
+        try:
+            return self.__changed
+        except AttributeError:
+            return None
+
+    @property
+    def dirty(self):
+        """True if the instance changed since it was last stored"""
+        return bool(self.__state())
+
+    @property
+    def changed(self):
+        """returns the names of the attributes changed since the instance
+        was last stored, all of them if it never was"""
+        changed = self.__state()
+        if changed is True:
+            return frozenset(k for k in self.__dict__ if k[0] != "_")
+        return frozenset(changed or ())
+
+    def clean(self):
+        """marks the instance as stored with its current values"""
+        self.__changed = None
 
     def __init__(self, *args, **kwargs):
         """Initialization of the base model"""
+        self.__changed = True
         if kwargs:
             for key, value in kwargs.items():
                 if key != "__class__":
-                    setattr(self, key, value)
+                    if key in self._references:
+                        value = references.intern(value)
+                    self.__store(key, value)
             if kwargs.get("created_at", None) and type(self.created_at) is str:
-                self.created_at = datetime.strptime(kwargs["created_at"], time)
-            else:
+                self.created_at = parse_time(kwargs["created_at"])
+            elif type(kwargs.get("created_at")) is not datetime:
                 self.created_at = datetime.utcnow()
             if kwargs.get("updated_at", None) and type(self.updated_at) is str:
-                self.updated_at = datetime.strptime(kwargs["updated_at"], time)
-            else:
+                self.updated_at = parse_time(kwargs["updated_at"])
+            elif type(kwargs.get("updated_at")) is not datetime:
                 self.updated_at = datetime.utcnow()
             if kwargs.get("id", None) is None:
-                self.id = str(uuid.uuid4())
+                self.id = ids.new_id()
         else:
-            self.id = str(uuid.uuid4())
+            self.id = ids.new_id()
             self.created_at = datetime.utcnow()
             self.updated_at = self.created_at
 
+    def __init_subclass__(cls, **kwargs):
+        """lists the reference attributes of a new model class"""
+        super().__init_subclass__(**kwargs)
+        cls._references = frozenset(name for name in dir(cls)
+                                    if name.endswith(suffixes))
+
+    @classmethod
+    def from_dicts(cls, records, stored=False):
+        """returns a list of instances of cls, one per dict of keyword
+        arguments for __init__ in records; stored tells the records were
+        read back from storage rather than received (see User), and
+        returns the instances clean
+
+        In file mode without slots, the instances of classes whose
+        __init__ only runs BaseModel's (_plain_init) get their
+        attributes in one dict update instead of going through
+        __init__; other classes and modes call cls(**record).
+        """
+        if not cls._plain_init or slotted or models.storage_t == "db":
+            objs = [cls(**record) for record in records]
+            if stored:
+                for obj in objs:
+                    obj.clean()
+            return objs
+        changed = None if stored else True
+        parse = parse_time
+        objs = []
+        intern = references.intern
+        refs = cls._references
+        for record in records:
+            if not record:
+                obj = cls()
+                obj.__changed = changed
+                objs.append(obj)
+                continue
+            obj = object.__new__(cls)
+            attrs = obj.__dict__
+            # filled key by key so the dict shares the class's keys
+            # rather than holding each record's own copies of them
+            for name, value in record.items():
+                if name != "__class__":
+                    attrs[name] = value
+            for name in refs:
+                if name in attrs:
+                    attrs[name] = intern(attrs[name])
+            for name in dates:
+                value = attrs.get(name)
+                if type(value) is not datetime:
+                    if value and type(value) is str:
+                        attrs[name] = parse(value)
+                    else:
+                        attrs[name] = datetime.utcnow()
+            if attrs.get("id") is None:
+                attrs["id"] = ids.new_id()
+            if changed:
+                obj.__changed = True
+            objs.append(obj)
+        return objs
+
     def __str__(self):
         """String representation of the BaseModel class"""
         return "[{:s}] ({:s}) {}".format(self.__class__.__name__, self.id,
@@ -58,19 +312,33 @@ class BaseModel:
         models.storage.new(self)
         models.storage.save()
 
-    def to_dict(self, del_pw=True):
-        """returns a dictionary containing all keys/values of the instance"""
+    def to_dict(self, del_pw=True, iso=True):
+        """returns a dictionary containing all keys/values of the instance,
+        with its dates as datetime objects rather than strings unless
+        iso, for codecs storing them natively"""
+        if del_pw is True and iso:
+            try:
+                updated_at, cached = self.__serialized
+                if updated_at is getattr(self, "updated_at", None):
+                    return cached.copy()
+            except (AttributeError, TypeError):
+                pass
         new_dict = self.__dict__.copy()
-        if "created_at" in new_dict:
-            new_dict["created_at"] = new_dict["created_at"].strftime(time)
-        if "updated_at" in new_dict:
-            new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
+        for name in dates if iso else ():
+            if name in new_dict:
+                new_dict[name] = \
+                    new_dict[name].isoformat(timespec="microseconds")
         new_dict["__class__"] = self.__class__.__name__
         if "_sa_instance_state" in new_dict:
             del new_dict["_sa_instance_state"]
+            for name in sqlalchemy.inspect(type(self)).relationships.keys():
+                new_dict.pop(name, None)
         if del_pw is True:
             if 'password' in new_dict:
                 del new_dict['password']
+            if iso:
+                self.__serialized = (getattr(self, "updated_at", None),
+                                     new_dict.copy())
         return new_dict
 
     def delete(self):
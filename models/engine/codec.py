@@ -0,0 +1,250 @@
+#!/usr/bin/python3
+"""
+Contains the codecs FileStorage snapshots can be written with
+
+Usage: python3 -m models.engine.codec <source> <destination> [json|binary]
+converts a snapshot file from one codec to the other.
+"""
+
+from datetime import datetime, timedelta
+import io
+import json
+from json.decoder import WHITESPACE
+import marshal
+import re
+import struct
+import sys
+from models.base_model import parse_time
+
+
+class JSONCodec:
+    """encodes snapshot records as the JSON object file.json always held
+
+    Dates are written as the ISO strings to_dict() makes of them;
+    datetime objects given instead are written the same way.
+    """
+
+    name = "json"
+    extension = ".json"
+    native_dates = False
+    colon = re.compile(r"\s*:\s*")
+    comma = re.compile(r"\s*([,}])\s*")
+
+    def dumps(self, records):
+        """returns the {key: dict} records encoded as bytes"""
+        return json.dumps(records, default=isoformat).encode("utf-8")
+
+    def loads(self, data):
+        """returns the {key: dict} records decoded from bytes"""
+        return json.loads(data)
+
+    def iterload(self, f, chunk_size=1 << 20):
+        """yields the (key, dict) records of the binary file f one by one
+
+        Only about chunk_size characters of the file and the record being
+        decoded are held in memory at any time. Records are decoded by
+        the scanner of the json module straight from the buffer, which is
+        refilled when one runs past its end.
+        """
+        text = io.TextIOWrapper(f, encoding="utf-8")
+        decoder = json.JSONDecoder()
+        buf = ""
+        pos = 0
+        eof = False
+
+        def parse(step):
+            """runs step(buf, pos) until the buffer holds enough for it"""
+            nonlocal buf, pos, eof
+            while True:
+                pos = WHITESPACE.match(buf, pos).end()
+                try:
+                    result, end = step(buf, pos)
+                    pos = end
+                    return result
+                except ValueError:
+                    if eof:
+                        raise
+                except IndexError:
+                    if eof:
+                        raise ValueError("truncated JSON snapshot")
+                chunk = text.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+
+        def char(expected):
+            """returns a step consuming one of the expected characters"""
+            def step(s, i):
+                """consumes the character of s at i"""
+                if s[i] not in expected:
+                    raise ValueError("expected one of " + expected)
+                return s[i], i + 1
+            return step
+
+        parse(char("{"))
+        if parse(char('"}')) == "}":
+            return
+        pos -= 1
+        scan = decoder.scan_once
+        colon = self.colon.match
+        comma = self.comma.match
+        while True:
+            try:
+                key, end = scan(buf, pos)
+                end = colon(buf, end).end()
+                value, end = scan(buf, end)
+                match = comma(buf, end)
+                end = match.end()
+            except (StopIteration, AttributeError, ValueError):
+                if eof:
+                    raise ValueError("corrupt or truncated JSON snapshot")
+                chunk = text.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = WHITESPACE.match(buf, 0).end()
+                continue
+            yield key, value
+            pos = end
+            if match.group(1) == "}":
+                return
+
+
+class BinaryCodec:
+    """encodes snapshot records in a compact, versioned binary format
+
+    The file starts with a header made of MAGIC, the format version and
+    the marshal version of the payload. The payload is a list of
+    (field names, rows) pairs: records are grouped by the tuple of their
+    field names, and each row is the key followed by the field values, so
+    field names are stored once per group rather than once per record.
+
+    Since version 2, the dates (fields named in dates) of naive datetimes
+    are not parsed or formatted: each group is a (field names, rows,
+    dates) triple, where dates maps the position of a date field in the
+    rows to its values packed as little-endian 64-bit integers, the
+    microseconds since the epoch (unset for the rows holding something
+    else there, which keep it). Version 1 files, which hold dates as ISO
+    strings, are still read.
+    """
+
+    name = "binary"
+    extension = ".bin"
+    native_dates = True
+    MAGIC = b"HBNB"
+    VERSION = 2
+    MARSHAL_VERSION = 4
+    header = struct.Struct("<4sHH")
+    dates = ("created_at", "updated_at")
+    epoch = datetime(1970, 1, 1)
+    microsecond = timedelta(microseconds=1)
+    unset = -1 << 63
+
+    def dumps(self, records):
+        """returns the {key: dict} records encoded as bytes; their dates
+        may be datetime objects or ISO strings"""
+        epoch = self.epoch
+        microsecond = self.microsecond
+        groups = {}
+        for key, record in records.items():
+            fields = tuple(record)
+            group = groups.get(fields)
+            if group is None:
+                group = groups[fields] = ([], {
+                    i + 1: [] for i, field in enumerate(fields)
+                    if field in self.dates})
+            rows, dates = group
+            row = (key,) + tuple(record.values())
+            if dates:
+                row = list(row)
+                for i, stamps in dates.items():
+                    value = row[i]
+                    if type(value) is str:
+                        value = parse_time(value)
+                    if type(value) is datetime and value.tzinfo is None:
+                        stamps.append((value - epoch) // microsecond)
+                        row[i] = None
+                    else:
+                        stamps.append(self.unset)
+                row = tuple(row)
+            rows.append(row)
+        payload = marshal.dumps([
+            (fields, rows, {i: struct.pack("<{:d}q".format(len(stamps)),
+                                           *stamps)
+                            for i, stamps in dates.items()})
+            for fields, (rows, dates) in groups.items()],
+            self.MARSHAL_VERSION)
+        return self.header.pack(self.MAGIC, self.VERSION,
+                                self.MARSHAL_VERSION) + payload
+
+    def loads(self, data):
+        """returns the {key: dict} records decoded from bytes"""
+        return dict(self.iterload(data))
+
+    def iterload(self, f):
+        """yields the (key, dict) records of bytes or a binary file
+
+        The payload is decoded at once, but records are only turned into
+        dicts one by one.
+        """
+        data = f if type(f) is bytes else f.read()
+        magic, version, marshal_version = self.header.unpack_from(data)
+        if magic != self.MAGIC or version not in (1, self.VERSION) or \
+           marshal_version > marshal.version:
+            raise ValueError("unsupported snapshot format")
+        epoch = self.epoch
+        microsecond = self.microsecond
+        unset = self.unset
+        for group in marshal.loads(data[self.header.size:]):
+            fields, rows = group[:2]
+            dates = []
+            for i, packed in group[2].items() if version > 1 else ():
+                stamps = struct.unpack("<{:d}q".format(len(rows)), packed)
+                dates.append((fields[i - 1], [
+                    None if stamp == unset else epoch + microsecond * stamp
+                    for stamp in stamps]))
+            for n, row in enumerate(rows):
+                record = dict(zip(fields, row[1:]))
+                for field, values in dates:
+                    value = values[n]
+                    if value is not None:
+                        record[field] = value
+                yield row[0], record
+
+
+def isoformat(value):
+    """returns the ISO string to_dict() makes of a datetime, for
+    json.dumps"""
+    if type(value) is datetime:
+        return value.isoformat(timespec="microseconds")
+    raise TypeError("{} is not JSON serializable".format(type(value)))
+
+
+codecs = {"json": JSONCodec(), "binary": BinaryCodec()}
+
+
+def detect(data):
+    """returns the codec that wrote data"""
+    if data[:len(BinaryCodec.MAGIC)] == BinaryCodec.MAGIC:
+        return codecs["binary"]
+    return codecs["json"]
+
+
+def convert(src, dst, name=None):
+    """rewrites the snapshot file src to dst with the codec called name,
+    by default the one src was not written with"""
+    with open(src, 'rb') as f:
+        data = f.read()
+    source = detect(data)
+    if name is None:
+        name = "json" if source.name == "binary" else "binary"
+    with open(dst, 'wb') as f:
+        f.write(codecs[name].dumps(source.loads(data)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4) or \
+       (len(sys.argv) == 4 and sys.argv[3] not in codecs):
+        print("Usage: {} <source> <destination> [json|binary]"
+              .format(sys.argv[0]))
+        sys.exit(1)
+    convert(*sys.argv[1:])
@@ -1,9 +1,36 @@
 #!/usr/bin/python3
 """Database storage engine using SQLAlchemy with a mysql+mysqldb database
 connection.
+
+HBNB_DB_URL, when set, is the full SQLAlchemy URL of the database to use
+instead of the one built from the HBNB_MYSQL_* variables. The connection
+pool is configured by HBNB_DB_POOL_SIZE, HBNB_DB_MAX_OVERFLOW,
+HBNB_DB_POOL_TIMEOUT (seconds to wait for a connection),
+HBNB_DB_POOL_RECYCLE (seconds after which a connection is replaced,
+3600 by default, below MySQL's wait_timeout), HBNB_DB_POOL_PRE_PING (1,
+the default, to test connections before use) and
+HBNB_DB_CONNECT_TIMEOUT (seconds to wait for the server).
+
+count() answers from counters of the rows of each table, which commits
+update with the objects they added or deleted, and which are checked
+against the tables with one query when older than HBNB_COUNT_MAX_AGE
+seconds (60 by default; 0 counts the rows on every call), to take in
+the changes of other processes.
+
+new_many(), update_many() and delete_many() write objects HBNB_DB_CHUNK_SIZE
+(1000 by default) at a time with one executemany or bulk statement per
+chunk, for imports; like new() and delete(), their changes are committed
+by save().
+
+all() and get() take the name of a loading profile (profiles) for the
+relationships their objects will be walked through, so that a page or a
+search runs one query per relationship rather than one per object.
 """
 
+from datetime import datetime
 import os
+import threading
+import time
 from models.base_model import Base
 from models.amenity import Amenity
 from models.city import City
@@ -11,8 +38,14 @@ from models.place import Place
 from models.state import State
 from models.review import Review
 from models.user import User
-from sqlalchemy import create_engine
+from sqlalchemy import bindparam, create_engine, delete, event, func
+from sqlalchemy import insert, inspect, select, update
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.orm import joinedload, make_transient_to_detached
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool
 name2class = {
     'Amenity': Amenity,
     'City': City,
@@ -21,6 +54,91 @@ name2class = {
     'Review': Review,
     'User': User
 }
+chunk_size = int(os.getenv('HBNB_DB_CHUNK_SIZE', '1000'))
+strategies = {"selectin": selectinload, "joined": joinedload}
+profiles = {
+    "states_cities": {"State": {"cities": "selectin"}},
+    "places_search": {
+        "State": {"cities.places.amenities": "selectin"},
+        "City": {"places.amenities": "selectin"},
+        "Place": {"amenities": "selectin"}
+    }
+}
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool recording the checkouts of connections and the time
+    they waited for one in timing"""
+
+    def __init__(self, *args, **kwargs):
+        """initializes the pool and its timing"""
+        super().__init__(*args, **kwargs)
+        self.timing = {"checkouts": 0, "wait_seconds": 0.0,
+                       "max_wait_seconds": 0.0}
+
+    def _do_get(self):
+        """returns a connection, timing the wait for it"""
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            wait = time.perf_counter() - start
+            timing = self.timing
+            timing["checkouts"] += 1
+            timing["wait_seconds"] += wait
+            if wait > timing["max_wait_seconds"]:
+                timing["max_wait_seconds"] = wait
+
+    def recreate(self):
+        """returns a new pool of the same settings keeping the timing"""
+        pool = super().recreate()
+        pool.timing = self.timing
+        return pool
+
+
+def engine_options(url):
+    """returns the create_engine keyword arguments the HBNB_DB_* pool
+    variables set for url"""
+    options = {
+        "pool_recycle": int(os.getenv('HBNB_DB_POOL_RECYCLE', '3600')),
+        "pool_pre_ping": os.getenv('HBNB_DB_POOL_PRE_PING', '1') == '1'
+    }
+    if url.get_dialect().get_pool_class(url) is QueuePool:
+        options["poolclass"] = TimedQueuePool
+    for name, var, kind in (("pool_size", 'HBNB_DB_POOL_SIZE', int),
+                            ("max_overflow", 'HBNB_DB_MAX_OVERFLOW', int),
+                            ("pool_timeout", 'HBNB_DB_POOL_TIMEOUT', float)):
+        if os.getenv(var):
+            options[name] = kind(os.getenv(var))
+    if os.getenv('HBNB_DB_CONNECT_TIMEOUT'):
+        timeout = int(os.getenv('HBNB_DB_CONNECT_TIMEOUT'))
+        if url.get_backend_name() == 'sqlite':
+            options["connect_args"] = {"timeout": timeout}
+        else:
+            options["connect_args"] = {"connect_timeout": timeout}
+    return options
+
+
+def loader_options(cls, profile):
+    """returns the loader options of the profile named profile for the
+    queries of cls: each relationship of each of its paths is loaded with
+    the path's strategy, selectin (one query for the objects of all the
+    rows) or joined (a join in the query of the rows)"""
+    options = []
+    if profile is None:
+        return options
+    for path, strategy in profiles[profile].get(cls.__name__, {}).items():
+        option = None
+        owner = cls
+        for name in path.split("."):
+            attr = getattr(owner, name)
+            if option is None:
+                option = strategies[strategy](attr)
+            else:
+                option = getattr(option, strategies[strategy].__name__)(attr)
+            owner = attr.property.mapper.class_
+        options.append(option)
+    return options
 
 
 class DBStorage:
@@ -30,45 +148,257 @@ class DBStorage:
 
     def __init__(self):
         """Initializes the object"""
-        user = os.getenv('HBNB_MYSQL_USER')
-        passwd = os.getenv('HBNB_MYSQL_PWD')
-        host = os.getenv('HBNB_MYSQL_HOST')
-        database = os.getenv('HBNB_MYSQL_DB')
-        self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'
-                                      .format(user, passwd, host, database))
+        if os.getenv('HBNB_DB_URL'):
+            url = make_url(os.getenv('HBNB_DB_URL'))
+        else:
+            url = URL.create('mysql+mysqldb',
+                             username=os.getenv('HBNB_MYSQL_USER'),
+                             password=os.getenv('HBNB_MYSQL_PWD'),
+                             host=os.getenv('HBNB_MYSQL_HOST'),
+                             database=os.getenv('HBNB_MYSQL_DB'))
+        self.__engine = create_engine(url, **engine_options(url))
+        self.__connects = 0
+        self.__invalidated = 0
+        self.__counts = None
+        self.__counted = 0.0
+        self.__reconciled = 0
+        self.__max_age = float(os.getenv('HBNB_COUNT_MAX_AGE', '60'))
+        self.__count_lock = threading.Lock()
+        event.listen(self.__engine, "connect", self.__connected)
+        event.listen(self.__engine, "invalidate", self.__invalidate)
         if os.getenv('HBNB_ENV') == 'test':
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
-        """returns a dictionary of all the objects present"""
+    def __connected(self, dbapi_connection, record):
+        """counts a new connection to the database"""
+        self.__connects += 1
+
+    def __invalidate(self, dbapi_connection, record, exception):
+        """counts a connection found broken"""
+        self.__invalidated += 1
+
+    def stats(self):
+        """returns the statistics of the connection pool: its size and
+        connections idle, checked out and in overflow, connections
+        opened and found broken, and the checkouts and seconds they
+        waited for a connection"""
+        pool = self.__engine.pool
+        stats = {"pool": type(pool).__name__, "connects": self.__connects,
+                 "invalidated": self.__invalidated}
+        if isinstance(pool, QueuePool):
+            stats.update({"size": pool.size(), "checked_in":
+                          pool.checkedin(), "checked_out":
+                          pool.checkedout(), "overflow": pool.overflow()})
+        stats.update(getattr(pool, "timing", {}))
+        stats["counts"] = {"reconciled": self.__reconciled, "age_seconds":
+                           time.monotonic() - self.__counted
+                           if self.__counts is not None else None}
+        return stats
+
+    def all(self, cls=None, profile=None):
+        """returns a dictionary of all the objects present, with the
+        relationships of the loading profile named profile loaded"""
         if not self.__session:
             self.reload()
         objects = {}
         if type(cls) == str:
             cls = name2class.get(cls, None)
-        if cls:
-            for obj in self.__session.query(cls):
+        for cls in [cls] if cls else name2class.values():
+            query = self.__session.query(cls)
+            for obj in query.options(*loader_options(cls, profile)):
                 objects[obj.__class__.__name__ + '.' + obj.id] = obj
-        else:
-            for cls in name2class.values():
-                for obj in self.__session.query(cls):
-                    objects[obj.__class__.__name__ + '.' + obj.id] = obj
         return objects
 
+    def iter(self, cls=None, batch_size=1000):
+        """yields the objects of class cls, or of every class, fetching
+        batch_size rows at a time through a server-side cursor
+
+        Rows are not all loaded at once and the objects yielded are only
+        kept by the session while referenced elsewhere, so memory does
+        not grow with the size of the tables. The connection is busy
+        with the cursor until the iteration ends: the objects should not
+        load relationships meanwhile.
+        """
+        if not self.__session:
+            self.reload()
+        if type(cls) == str:
+            cls = name2class.get(cls, None)
+        for cls in [cls] if cls else name2class.values():
+            yield from self.__session.query(cls).yield_per(batch_size)
+
     def reload(self):
         """reloads objects from the database"""
         session_factory = sessionmaker(bind=self.__engine,
                                        expire_on_commit=False)
+        event.listen(session_factory, "after_flush", self.__flushed)
+        event.listen(session_factory, "after_commit", self.__committed)
+        event.listen(session_factory, "after_rollback", self.__rolled_back)
         Base.metadata.create_all(self.__engine)
         self.__session = scoped_session(session_factory)
 
+    def migrate(self):
+        """applies the pending schema migrations of models.engine.schema
+        and returns their versions"""
+        from models.engine import schema
+        return schema.migrate(self.__engine)
+
+    def check_indexes(self):
+        """returns whether the hot queries use their indexes (see
+        models.engine.schema.check)"""
+        from models.engine import schema
+        return schema.check(self.__engine)
+
     def new(self, obj):
         """creates a new object"""
         self.__session.add(obj)
 
+    def new_many(self, objs, chunk_size=None):
+        """inserts the objects objs, chunk_size at a time
+
+        The rows of each chunk are inserted with one executemany of the
+        table's INSERT, and the objects then added to the session as
+        stored and clean. Objects with related objects set go through the
+        session instead, which inserts those too, and objects already in
+        the session are left to save().
+        """
+        if not self.__session:
+            self.reload()
+        session = self.__session()
+        for cls, chunk in self.__chunks(objs, chunk_size):
+            mapper = inspect(cls)
+            relations = [rel.key for rel in mapper.relationships]
+            columns = [attr.key for attr in mapper.column_attrs]
+            defaults = {attr.key: attr.columns[0].default.arg
+                        for attr in mapper.column_attrs
+                        if attr.columns[0].default is not None and
+                        attr.columns[0].default.is_scalar}
+            plain = []
+            related = []
+            for obj in chunk:
+                if not inspect(obj).transient:
+                    continue
+                if any(obj.__dict__.get(key) for key in relations):
+                    related.append(obj)
+                else:
+                    plain.append(obj)
+            if related:
+                session.add_all(related)
+                session.flush()
+                for obj in related:
+                    obj.clean()
+            if plain:
+                rows = []
+                for obj in plain:
+                    for key, value in defaults.items():
+                        if key not in obj.__dict__:
+                            setattr(obj, key, value)
+                    rows.append({key: obj.__dict__.get(key)
+                                 for key in columns})
+                session.execute(insert(cls.__table__), rows)
+                self.__count(session, cls, len(plain))
+                for obj in plain:
+                    make_transient_to_detached(obj)
+                    obj.clean()
+                session.add_all(plain)
+
+    def update_many(self, objs, chunk_size=None):
+        """stores the changes of the stored objects objs, chunk_size at a
+        time, stamping their updated_at like BaseModel.save()
+
+        The rows of each chunk whose objects changed the same columns are
+        updated with one executemany of their UPDATE, after which the
+        session holds the objects' values as stored.
+        """
+        if not self.__session:
+            self.reload()
+        session = self.__session()
+        now = datetime.utcnow()
+        for cls, chunk in self.__chunks(objs, chunk_size):
+            table = cls.__table__
+            columns = {attr.key for attr in inspect(cls).column_attrs}
+            columns.discard("id")
+            groups = {}
+            for obj in chunk:
+                obj.updated_at = now
+                keys = tuple(sorted(columns.intersection(obj.changed)))
+                groups.setdefault(keys, []).append(obj)
+            with session.no_autoflush:
+                for keys, group in groups.items():
+                    statement = update(table).where(
+                        table.c.id == bindparam("_id")).values(
+                        {key: bindparam(key) for key in keys})
+                    session.execute(statement, [
+                        dict({key: obj.__dict__[key] for key in keys},
+                             _id=obj.id) for obj in group])
+                    for obj in group:
+                        for key in keys:
+                            set_committed_value(obj, key, obj.__dict__[key])
+                        obj.clean()
+
+    def delete_many(self, objs, chunk_size=None):
+        """deletes the objects objs, chunk_size at a time, with one
+        DELETE of the rows of each chunk (see __delete_rows)"""
+        if not self.__session:
+            self.reload()
+        session = self.__session()
+        session.flush()
+        for cls, chunk in self.__chunks(objs, chunk_size):
+            self.__delete_rows(session, cls, [obj.id for obj in chunk])
+            for obj in chunk:
+                if obj in session:
+                    session.expunge(obj)
+
+    def __delete_rows(self, session, cls, ids):
+        """deletes the rows of cls whose id is in ids, as session.delete()
+        would: with their rows in association tables, and first the rows
+        of the relationships cascading deletes"""
+        for rel in inspect(cls).relationships:
+            if rel.secondary is not None:
+                for column, other in rel.synchronize_pairs:
+                    session.execute(delete(rel.secondary)
+                                    .where(other.in_(ids)))
+            elif rel.cascade.delete and rel.uselist:
+                target = rel.mapper.class_
+                column, = rel.remote_side
+                children = session.scalars(select(target.id)
+                                           .where(column.in_(ids))).all()
+                if children:
+                    self.__delete_rows(session, target, children)
+        result = session.execute(delete(cls.__table__)
+                                 .where(cls.__table__.c.id.in_(ids)))
+        self.__count(session, cls, -result.rowcount)
+
+    @staticmethod
+    def __chunks(objs, size):
+        """yields the objects objs chunk by chunk, with their class, in
+        chunks of at most size (chunk_size by default) of one class"""
+        size = size or chunk_size
+        chunk = []
+        for obj in objs:
+            if chunk and (len(chunk) == size or
+                          obj.__class__ is not chunk[0].__class__):
+                yield chunk[0].__class__, chunk
+                chunk = []
+            chunk.append(obj)
+        if chunk:
+            yield chunk[0].__class__, chunk
+
+    @staticmethod
+    def __count(session, cls, delta):
+        """records delta objects of cls written outside flushes, to count
+        them when the session commits"""
+        deltas = session.info.setdefault("counts", {})
+        deltas[cls.__name__] = deltas.get(cls.__name__, 0) + delta
+
     def save(self):
-        """saves the current session"""
+        """saves the current session, marking the objects it held clean
+
+        SQLAlchemy only updates the columns that changed.
+        """
+        objs = list(self.__session.new) + list(self.__session.dirty)
         self.__session.commit()
+        for obj in objs:
+            obj.clean()
 
     def delete(self, obj=None):
         """deletes an object"""
@@ -81,23 +411,76 @@ class DBStorage:
         """Dispose of current session if active"""
         self.__session.remove()
 
-    def get(self, cls, id):
-        """Retrieve an object"""
-        if cls is not None and type(cls) is str and id is not None and\
+    def get(self, cls, id, profile=None):
+        """Retrieve an object, with the relationships of the loading
+        profile named profile loaded"""
+        if cls is not None and type(cls) != str:
+            cls = cls.__name__
+        if cls is not None and id is not None and\
            type(id) is str and cls in name2class:
             cls = name2class[cls]
-            result = self.__session.query(cls).filter(cls.id == id).first()
-            return result
+            query = self.__session.query(cls).filter(cls.id == id)
+            return query.options(*loader_options(cls, profile)).first()
         else:
             return None
 
+    def get_many(self, cls, ids, profile=None):
+        """returns a dictionary of the objects of cls found among ids, by
+        id, read with one IN (...) query (profile: see get())"""
+        if cls is not None and type(cls) != str:
+            cls = cls.__name__
+        ids = {id for id in ids if type(id) is str}
+        if cls not in name2class or not ids:
+            return {}
+        cls = name2class[cls]
+        query = self.__session.query(cls).filter(cls.id.in_(ids))
+        return {obj.id: obj
+                for obj in query.options(*loader_options(cls, profile))}
+
     def count(self, cls=None):
         """Count number of objects in storage"""
-        total = 0
-        if type(cls) == str and cls in name2class:
-            cls = name2class[cls]
-            total = self.__session.query(cls).count()
-        elif cls is None:
-            for cls in name2class.values():
-                total += self.__session.query(cls).count()
-        return total
+        if cls is not None and type(cls) != str:
+            cls = cls.__name__
+        if cls is not None and cls not in name2class:
+            return 0
+        with self.__count_lock:
+            if self.__counts is None or \
+               time.monotonic() - self.__counted >= self.__max_age:
+                self.reconcile()
+            if cls is None:
+                return sum(self.__counts.values())
+            return self.__counts[cls]
+
+    def reconcile(self):
+        """sets the counters to the numbers of rows of the tables"""
+        query = select(*(select(func.count()).select_from(cls)
+                         .scalar_subquery().label(name)
+                         for name, cls in name2class.items()))
+        with self.__engine.connect() as connection:
+            row = connection.execute(query).one()
+        self.__counts = dict(row._mapping)
+        self.__counted = time.monotonic()
+        self.__reconciled += 1
+
+    def __flushed(self, session, flush_context):
+        """records the objects a flush added or deleted, to count them
+        when the session commits"""
+        deltas = session.info.setdefault("counts", {})
+        for objs, delta in ((session.new, 1), (session.deleted, -1)):
+            for obj in objs:
+                name = obj.__class__.__name__
+                deltas[name] = deltas.get(name, 0) + delta
+
+    def __committed(self, session):
+        """adds the objects the session committed to the counters"""
+        deltas = session.info.pop("counts", None)
+        if deltas:
+            with self.__count_lock:
+                if self.__counts is not None:
+                    for name, delta in deltas.items():
+                        if name in self.__counts:
+                            self.__counts[name] += delta
+
+    def __rolled_back(self, session):
+        """forgets the objects the session rolled back"""
+        session.info.pop("counts", None)
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""
+Contains the FileLock class used by FileStorage's multi-process mode
+"""
+
+from contextlib import contextmanager
+import fcntl
+
+
+class FileLock:
+    """advisory lock, through flock, shared by every process using path
+
+    Locks are reentrant within a process: a lock taken while this
+    process already holds one is a no-op, so the outer lock decides
+    between shared and exclusive. Callers serialize their own threads.
+    """
+
+    def __init__(self, path):
+        """initializes the lock on the file at path"""
+        self.path = path
+        self.__depth = 0
+
+    @contextmanager
+    def __locked(self, operation):
+        """holds the lock with the flock operation given"""
+        if self.__depth > 0:
+            self.__depth += 1
+            try:
+                yield
+            finally:
+                self.__depth -= 1
+            return
+        with open(self.path, 'a') as f:
+            fcntl.flock(f.fileno(), operation)
+            self.__depth = 1
+            try:
+                yield
+            finally:
+                self.__depth = 0
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def exclusive(self):
+        """returns a context holding the lock for writing"""
+        return self.__locked(fcntl.LOCK_EX)
+
+    def shared(self):
+        """returns a context holding the lock for reading"""
+        return self.__locked(fcntl.LOCK_SH)
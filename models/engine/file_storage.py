@@ -3,10 +3,30 @@
 Contains the FileStorage class
 """
 
-import json
+from collections.abc import Mapping
+from contextlib import nullcontext
+from datetime import datetime
+import heapq
+from itertools import islice
+import os
+try:
+    import resource
+except ImportError:
+    resource = None
+import threading
+import time
+from types import MappingProxyType
+import models
 from models.amenity import Amenity
-from models.base_model import BaseModel
+from models.base_model import BaseModel, parse_time
 from models.city import City
+from models.engine.codec import codecs
+from models.engine.file_lock import FileLock
+from models.engine.group_commit import GroupCommit
+from models.engine.journal import Journal
+from models.engine.record_file import RecordFile
+from models.engine.snapshot import Snapshot
+from models.intern import references
 from models.place import Place
 from models.review import Review
 from models.state import State
@@ -14,74 +34,843 @@ from models.user import User
 
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
+relations = {"City": ("state_id",),
+             "Place": ("city_id", "user_id", "amenity_ids"),
+             "Review": ("place_id", "user_id")}
+
+
+class ClassView(Mapping):
+    """read-only view of the objects of one class of an indexed FileStorage
+
+    Objects are only decoded from the record file as they are looked up
+    or iterated over.
+    """
+
+    def __init__(self, name, keys, get, size):
+        """initializes the view of class name from callables returning its
+        keys, the object of a key and the number of objects"""
+        self.__prefix = name + "."
+        self.__keys = keys
+        self.__get = get
+        self.__size = size
+
+    def __getitem__(self, key):
+        """returns the object stored under key"""
+        obj = None
+        if key.startswith(self.__prefix):
+            obj = self.__get(key)
+        if obj is None:
+            raise KeyError(key)
+        return obj
+
+    def __iter__(self):
+        """iterates over the keys of the class"""
+        return self.__keys()
+
+    def __len__(self):
+        """returns the number of objects of the class"""
+        return self.__size()
 
 
 class FileStorage:
-    """serializes instances to a JSON file & deserializes back to instances"""
+    """serializes instances to a JSON file & deserializes back to instances
+
+    When HBNB_FILE_SHARDS names a directory, each class is kept in its own
+    <class name>.json file there instead of file.json. A class is only read
+    the first time one of its objects is asked for, and save() only
+    rewrites the files of classes passed to new()/delete() since the last
+    save.
+
+    HBNB_FILE_FORMAT=binary writes the snapshot with the compact binary
+    codec of models.engine.codec (file.bin, or <class name>.bin shards)
+    instead of JSON.
+
+    HBNB_FILE_FORMAT=indexed keeps the objects in file.rec, a RecordFile
+    that is memory-mapped instead of read: nothing is decoded at startup,
+    get() decodes just the record asked for and all(cls) returns a
+    ClassView decoding records as it is iterated. Decoded objects stay in
+    __objects; __extra and __deleted track, per class, the keys added to
+    and removed from the file since it was written. Relationship getters
+    and all() without a class decode every object of the classes they
+    cover.
+
+    When HBNB_FILE_JOURNAL names a log file, save() appends only the objects
+    passed to new()/delete() since the last save to that log instead of
+    rewriting the JSON files. The log is folded back into the JSON files
+    by compact() once it grows past HBNB_FILE_JOURNAL_MAX bytes or,
+    if HBNB_FILE_COMPACT_INTERVAL is set, every that many seconds.
+
+    HBNB_FILE_SHARED=1 lets several processes (e.g. gunicorn workers) share
+    the files: it turns journal mode on (<snapshot>.log unless
+    HBNB_FILE_JOURNAL says otherwise) and takes a FileLock on
+    <snapshot>.lock, exclusive to write, shared to read. Before appending
+    its own records a writer applies those appended by the others, and
+    close() applies only the records appended since it last looked, so
+    each process refreshes just what changed. Objects passed to new() or
+    delete() and not saved yet are never overwritten by a refresh.
+
+    When HBNB_FILE_COMMIT_WINDOW is a number of seconds, save() returns at
+    once and a background GroupCommit writes once for all the saves made
+    within that window; flush() is the barrier for callers that need the
+    data on disk, and is also run at exit.
+
+    reload() streams the snapshot: records are decoded and turned into
+    objects one at a time, so besides the objects themselves it holds
+    about one chunk of the file and one record in memory (the binary
+    codec still decodes its payload at once). It calls progress, if
+    given, every __progress_every records with the statistics of the
+    load so far, which stats() also returns once the load is over.
+
+    Objects track their own changes (see BaseModel.dirty): new() ignores
+    objects it already holds that did not change, and only reindexes
+    those whose foreign keys changed. save() writes nothing when no
+    object was added, deleted or changed since the snapshot was written,
+    and the indexed format copies the records of unchanged objects as
+    they are. Written and loaded objects are marked clean.
+
+    Reloads only rebuild the objects whose record has another updated_at
+    than the object in memory, and leave alone objects changed since they
+    were last read or written.
+
+    __partitions holds the same objects as __objects grouped by class name,
+    so all(cls) and count(cls) do not scan every object, and __refs maps
+    (class name, attribute) to {referenced id: objects} for the foreign
+    keys listed in relations, so related() does not either; __entries
+    keeps, per key, the tuple of the values it is indexed under. __refs
+    and __entries are only built the first time related() is called, so
+    that processes never walking relationships do not pay for them. An
+    object is reindexed each time it goes through new() or one of its
+    foreign keys is set, and the maps are rebuilt if __objects is
+    replaced by another dict.
+
+    new_many(), update_many() and delete_many() take the lock once per
+    chunk of objects rather than once per object, and release it between
+    chunks so that an import does not hold up the other threads.
+    """
 
     __file_path = "file.json"
     __objects = {}
+    __format = os.getenv("HBNB_FILE_FORMAT", "json")
+    __records = None
+    if __format == "indexed":
+        __file_path = "file.rec"
+        __records = RecordFile(__file_path)
+        __format = "json"
+    elif __format != "json":
+        __file_path = "file" + codecs[__format].extension
+    __snapshot = Snapshot(__file_path, codec=__format)
+    if os.getenv("HBNB_FILE_SHARDS") and __records is None:
+        __snapshot = Snapshot(os.getenv("HBNB_FILE_SHARDS"), sharded=True,
+                              codec=__format)
+    __journal = None
+    if os.getenv("HBNB_FILE_JOURNAL"):
+        __journal = Journal(os.getenv("HBNB_FILE_JOURNAL"))
+    __shared = None
+    if os.getenv("HBNB_FILE_SHARED"):
+        __shared = FileLock(__snapshot.path + ".lock")
+        if __journal is None:
+            __journal = Journal(__snapshot.path + ".log")
+    __journal_max = int(os.getenv("HBNB_FILE_JOURNAL_MAX", 1024 * 1024))
+    __compact_interval = float(os.getenv("HBNB_FILE_COMPACT_INTERVAL", 0))
+    __last_compact = time.time()
+    __pending = {}
+    __dirty = set()
+    __loaded = set()
+    __sigs = {}
+    __journal_pos = 0
+    __extra = {}
+    __deleted = {}
+    __partitions = {}
+    __refs = None
+    __entries = None
+    __partitioned = None
+    __commit_window = float(os.getenv("HBNB_FILE_COMMIT_WINDOW", 0))
+    __committer = None
+    __lock = threading.RLock()
+    __load_stats = {}
+    __progress_every = 10000
+    __batch_size = 1000
 
-    def all(self, cls=None):
-        """returns the dictionary __objects"""
-        if not cls:
-            return self.__objects
-        elif type(cls) == str:
-            return {k: v for k, v in self.__objects.items()
-                    if v.__class__.__name__ == cls}
-        else:
-            return {k: v for k, v in self.__objects.items()
-                    if v.__class__ == cls}
+    def all(self, cls=None, profile=None):
+        """returns the dictionary __objects, or a read-only view of the
+        objects of class cls
+
+        profile, the name of a DBStorage loading profile, is accepted for
+        compatibility: relationships are looked up in the indexes here.
+        """
+        if cls is not None and type(cls) != str:
+            cls = cls.__name__
+        with self.__lock:
+            if not cls:
+                for name in classes:
+                    self.__ensure(name, materialize=True)
+                return self.__objects
+            if self.__records is not None:
+                return ClassView(cls, lambda: self.__keys(cls),
+                                 self.__materialize, lambda: self.count(cls))
+            self.__ensure(cls)
+            return MappingProxyType(self.__partition(cls))
+
+    def iter(self, cls=None, batch_size=1000):
+        """yields the objects of class cls, or of every class, without
+        building a dictionary of them
+
+        The keys of each class are read batch_size at a time. Objects
+        of an indexed snapshot that are not in memory are decoded for
+        the iteration only, without being kept, so that memory does not
+        grow with the number of objects: they are meant to be read.
+        The lock is taken per batch, not while the caller holds an object.
+        Without cls, objects in memory come in the order they were stored,
+        as in all().
+        """
+        if cls is not None and type(cls) != str:
+            cls = cls.__name__
+        units = [name for name in classes if cls is None or cls == name]
+        if cls is None and self.__records is None:
+            with self.__lock:
+                for name in units:
+                    self.__ensure(name)
+                units = [None]
+        for name in units:
+            with self.__lock:
+                if name is not None:
+                    self.__ensure(name)
+                if name is None:
+                    keys = iter(list(self.__objects))
+                elif self.__records is not None:
+                    keys = self.__keys(name)
+                else:
+                    keys = iter(list(self.__partition(name)))
+            while True:
+                with self.__lock:
+                    objs = [self.__materialize(key, keep=False)
+                            for key in islice(keys, batch_size)]
+                if not objs:
+                    break
+                for obj in objs:
+                    if obj is not None:
+                        yield obj
+
+    def related(self, cls, attr, value):
+        """returns the objects of class cls whose attr refers to value"""
+        if type(cls) != str:
+            cls = cls.__name__
+        with self.__lock:
+            self.__ensure(cls, materialize=True)
+            self.__sync_indexes()
+            if self.__refs is None:
+                FileStorage.__refs = {}
+                FileStorage.__entries = {}
+                for name in relations:
+                    partition = self.__partitions.get(name, {})
+                    self.__index_refs(name, list(partition),
+                                      list(partition.values()))
+            return list(self.__refs.get((cls, attr), {})
+                        .get(value, {}).values())
+
+    def __sync_indexes(self):
+        """rebuilds the class partitions, and drops the reference indexes
+        until related() needs them, if __objects was replaced by another
+        dict"""
+        if self.__partitioned is not self.__objects:
+            FileStorage.__partitions = {}
+            FileStorage.__refs = None
+            FileStorage.__entries = None
+            FileStorage.__partitioned = self.__objects
+            for key, obj in self.__objects.items():
+                self.__index(obj.__class__.__name__, (key,), (obj,))
+
+    def __partition(self, name):
+        """returns the dictionary of the objects of class name"""
+        self.__sync_indexes()
+        return self.__partitions.setdefault(name, {})
+
+    def __index(self, name, keys, objs):
+        """adds the objects objs of class name, stored under keys, to their
+        class partition and, once built, reference indexes"""
+        self.__partitions.setdefault(name, {}).update(zip(keys, objs))
+        if self.__refs is not None:
+            self.__index_refs(name, keys, objs)
+
+    def __index_refs(self, name, keys, objs):
+        """adds the objects objs of class name, stored under keys, to the
+        reference indexes"""
+        attrs = relations.get(name)
+        if attrs is None:
+            return
+        maps = [self.__refs.setdefault((name, attr), {}) for attr in attrs]
+        entries = self.__entries
+        for key, obj in zip(keys, objs):
+            entry = []
+            for attr, refs in zip(attrs, maps):
+                value = getattr(obj, attr, None)
+                if type(value) is list:
+                    value = tuple(value)
+                    for v in value:
+                        refs.setdefault(v, {})[key] = obj
+                else:
+                    refs.setdefault(value, {})[key] = obj
+                entry.append(value)
+            entries[key] = tuple(entry)
+
+    def __unindex(self, key):
+        """removes key from its class partition and reference indexes"""
+        name = key.partition(".")[0]
+        partition = self.__partitions.get(name)
+        if partition is None or partition.pop(key, None) is None or \
+           self.__entries is None:
+            return
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return
+        for attr, value in zip(relations[name], entry):
+            refs = self.__refs[(name, attr)]
+            for v in value if type(value) is tuple else (value,):
+                objs = refs.get(v)
+                if objs is not None:
+                    objs.pop(key, None)
+                    if not objs:
+                        del refs[v]
+
+    def reindex(self, obj):
+        """updates the reference indexes of obj, if it is stored, after
+        one of its reference attributes changed (see BaseModel._moved)"""
+        key = obj.__class__.__name__ + "." + obj.id
+        with self.__lock:
+            if self.__objects.get(key) is obj and self.__refs is not None \
+               and self.__partitioned is self.__objects:
+                self.__unindex(key)
+                self.__index(obj.__class__.__name__, (key,), (obj,))
+
+    def __put(self, key, obj):
+        """stores obj under key in __objects and its indexes"""
+        self.__put_many(obj.__class__.__name__, (key,), (obj,))
+
+    def __put_many(self, name, keys, objs):
+        """stores the objects objs of class name under keys in __objects
+        and its indexes"""
+        self.__sync_indexes()
+        partition = self.__partitions.get(name, ())
+        for key in keys:
+            if key in partition:
+                self.__unindex(key)
+        self.__index(name, keys, objs)
+        self.__objects.update(zip(keys, objs))
+        if self.__records is not None:
+            extra = self.__extra.setdefault(name, set())
+            deleted = self.__deleted.get(name, set())
+            for key in keys:
+                if key in self.__records:
+                    deleted.discard(key)
+                else:
+                    extra.add(key)
+
+    def __drop(self, key):
+        """removes key from __objects and its indexes"""
+        self.__sync_indexes()
+        self.__unindex(key)
+        if self.__records is not None:
+            name = key.partition(".")[0]
+            self.__extra.get(name, set()).discard(key)
+            if key in self.__records:
+                self.__deleted.setdefault(name, set()).add(key)
+        return self.__objects.pop(key, None)
+
+    def __materialize(self, key, keep=True):
+        """returns the object stored under key, decoding it from the record
+        file of an indexed snapshot if needed, and keeping it in __objects
+        with keep
+
+        It takes the lock itself, as the ClassView of all() calls it."""
+        obj = self.__objects.get(key)
+        if obj is not None or self.__records is None:
+            return obj
+        with self.__lock:
+            obj = self.__objects.get(key)
+            if obj is None and self.__records is not None and \
+               key not in self.__deleted.get(key.partition(".")[0], ()):
+                record = self.__records.get(key)
+                if record is not None and record.get("__class__") in classes:
+                    cls = classes[record["__class__"]]
+                    obj, = cls.from_dicts((record,), stored=True)
+                    if keep:
+                        self.__put(key, obj)
+        return obj
+
+    def __keys(self, name):
+        """yields the keys of the objects of class name in an indexed
+        snapshot, decoded or not"""
+        deleted = self.__deleted.get(name, ())
+        for key in self.__records.keys(name + "."):
+            if key not in deleted:
+                yield key
+        for key in list(self.__extra.get(name, ())):
+            yield key
 
     def new(self, obj):
         """sets in __objects the obj with key <obj class name>.id"""
         if obj is not None:
-            key = obj.__class__.__name__ + "." + obj.id
-            self.__objects[key] = obj
+            self.new_many((obj,))
+
+    def new_many(self, objs, chunk_size=1000):
+        """sets in __objects each of objs, taking the lock and loading
+        the file of each class once per chunk of chunk_size objects, so
+        that other threads are not held up for the whole of an import"""
+        objs = iter(objs)
+        ensured = set()
+        for chunk in iter(lambda: list(islice(objs, chunk_size)), []):
+            with self.__lock:
+                for obj in chunk:
+                    name = obj.__class__.__name__
+                    key = name + "." + obj.id
+                    if name not in ensured:
+                        self.__ensure(name)
+                        ensured.add(name)
+                    if self.__objects.get(key) is obj:
+                        if not obj.dirty:
+                            continue
+                        if not obj.changed.isdisjoint(
+                                relations.get(name, ())):
+                            self.__put(key, obj)
+                    else:
+                        self.__put(key, obj)
+                    self.__dirty.add(name)
+                    if self.__journal is not None:
+                        self.__pending[key] = obj
+
+    def update_many(self, objs, chunk_size=1000):
+        """stamps the updated_at of each of objs, like BaseModel.save(),
+        and sets them in __objects chunk_size at a time"""
+        now = datetime.utcnow()
+        objs = list(objs)
+        for obj in objs:
+            obj.updated_at = now
+        self.new_many(objs, chunk_size)
 
     def save(self):
         """serializes __objects to the JSON file (path: __file_path)"""
-        json_objects = {}
-        for key in self.__objects:
-            json_objects[key] = self.__objects[key].to_dict(save_to_disk=True)
-        with open(self.__file_path, 'w') as f:
-            json.dump(json_objects, f)
-
-    def reload(self):
-        """deserializes the JSON file to __objects"""
+        if self.__commit_window <= 0:
+            self.__write()
+            return
+        if self.__committer is None:
+            FileStorage.__committer = GroupCommit(self.__write,
+                                                  self.__commit_window)
+        self.__committer.request()
+
+    def flush(self):
+        """returns once every save made so far is written to disk"""
+        if self.__committer is not None:
+            self.__committer.barrier()
+
+    def __write(self):
+        """writes the changes saved so far to the journal or JSON files
+
+        The journal gets the objects passed to new() or delete() since the
+        last write and the objects changed in place (see BaseModel.dirty).
+        """
+        with self.__lock, self.__disk_lock(exclusive=True):
+            if self.__shared is not None:
+                self.__refresh()
+            if self.__journal is None:
+                if not self.__unchanged():
+                    self.__write_snapshot()
+                return
+            self.__sync_indexes()
+            for objs in self.__partitions.values():
+                for key, obj in objs.items():
+                    if obj.dirty and key not in self.__pending:
+                        self.__pending[key] = obj
+            records = []
+            for key, obj in self.__pending.items():
+                if obj is not None:
+                    record = obj.to_dict(del_pw=False)
+                    obj.clean()
+                    obj = record
+                records.append((key, obj))
+            self.__pending.clear()
+            in_sync = self.__journal.size() == self.__journal_pos
+            self.__journal.append(records)
+            if in_sync:
+                FileStorage.__journal_pos = self.__journal.size()
+            elapsed = time.time() - self.__last_compact
+            if self.__journal.size() > self.__journal_max or \
+               0 < self.__compact_interval < elapsed:
+                self.compact()
+
+    def __unchanged(self):
+        """returns True if the snapshot on disk holds the objects as they
+        are, adding to __dirty the classes of objects changed in place"""
+        if self.__partitioned is not self.__objects or \
+           sum(map(len, self.__partitions.values())) != \
+           len(self.__objects):
+            return False
+        for name, objs in self.__partitions.items():
+            if name not in self.__dirty and \
+               any(obj.dirty for obj in objs.values()):
+                self.__dirty.add(name)
+        if self.__dirty:
+            return False
+        if self.__records is not None:
+            return self.__records.stat() == self.__sigs.get(None)
+        return self.__snapshot.sharded or \
+            self.__snapshot.stat() == self.__sigs.get(None)
+
+    def compact(self):
+        """folds the journal into the JSON files and empties it"""
+        with self.__lock, self.__disk_lock(exclusive=True):
+            if self.__journal is not None and self.__snapshot.sharded:
+                for key, record in self.__journal.replay():
+                    name = key.partition(".")[0]
+                    if name in classes:
+                        self.__ensure(name)
+                        self.__dirty.add(name)
+            self.__write_snapshot()
+            self.__pending.clear()
+            if self.__journal is not None:
+                self.__journal.truncate()
+            FileStorage.__journal_pos = 0
+            FileStorage.__last_compact = time.time()
+
+    def __write_snapshot(self):
+        """writes the objects to the JSON files through temporary files
+
+        A sharded snapshot only rewrites the files of dirty classes.
+        """
+        if self.__records is not None:
+            self.__write_records()
+            return
+        if self.__snapshot.sharded:
+            names = [name for name in self.__dirty if name in classes]
+        else:
+            names = [None]
+        for name in names:
+            if name is None:
+                objs = self.__objects
+            else:
+                objs = self.__partition(name)
+            iso = not self.__snapshot.codec.native_dates
+            records = {}
+            for key in objs:
+                records[key] = objs[key].to_dict(del_pw=False, iso=iso)
+            self.__snapshot.write(records, name)
+            self.__sigs[name] = self.__snapshot.stat(name)
+            for obj in objs.values():
+                obj.clean()
+        self.__dirty.clear()
+
+    def __write_records(self):
+        """rewrites the record file of an indexed snapshot, copying the
+        records that were never decoded as they are"""
+        def stored():
+            """yields the records of the current file still wanted"""
+            for key in self.__records.keys():
+                name = key.partition(".")[0]
+                if key in self.__deleted.get(name, ()):
+                    continue
+                obj = self.__objects.get(key)
+                if obj is not None and obj.dirty:
+                    yield key, encode(key)
+                else:
+                    yield key, self.__records.raw(key)
+
+        def encode(key):
+            """returns the encoded record of a decoded object"""
+            obj = self.__objects[key]
+            record = obj.to_dict(del_pw=False)
+            obj.clean()
+            return RecordFile.encode(record)
+
+        extra = sorted(key for keys in self.__extra.values() for key in keys)
+        self.__records.write(heapq.merge(stored(), ((key, encode(key))
+                                                    for key in extra),
+                                         key=lambda record: record[0]))
+        FileStorage.__extra = {}
+        FileStorage.__deleted = {}
+        self.__sigs[None] = self.__records.stat()
+        self.__dirty.clear()
+
+    def __load_records(self):
+        """maps the current record file of an indexed snapshot and applies
+        its changes to the objects decoded so far"""
+        self.__records.open()
+        self.__sigs[None] = self.__records.stat()
+        self.__loaded.clear()
+        for name in self.__extra:
+            self.__extra[name] = {key for key in self.__extra[name]
+                                  if key not in self.__records}
+        for name in self.__deleted:
+            self.__deleted[name] = {key for key in self.__deleted[name]
+                                    if key in self.__records}
+        self.__apply((key, self.__records.get(key))
+                     for key in self.__stored(None))
+
+    def __stored(self, name):
+        """returns the keys of the objects in memory, of class name or of
+        every class, that were not changed since they were last read or
+        written"""
+        if name is None:
+            objs = self.__objects
+        else:
+            objs = self.__partition(name)
+        return [key for key, obj in objs.items() if not obj.dirty]
+
+    def __apply(self, records, same=False):
+        """rebuilds the objects stored under the keys of the (key, record)
+        pairs of records from their records on disk
+
+        A None record deletes the object. Records of objects in memory
+        that have the same updated_at are skipped unless same is True (the
+        journal holds objects changed in place with the updated_at they
+        had), and so are records of classes whose file was not loaded yet
+        and records of keys with changes not saved yet (pending or dirty
+        objects). The objects of each class are built by one from_dicts()
+        call, up to the next deletion or key seen twice.
+        """
+        batches = {}
+        batched = set()
+        objects = self.__objects
+        pending = self.__pending
+        sharded = self.__snapshot.sharded
+        for key, record in records:
+            if sharded and key.partition(".")[0] not in self.__loaded or \
+               key in pending:
+                continue
+            obj = objects.get(key)
+            if obj is not None and obj.dirty:
+                continue
+            if record is None or key in batched:
+                self.__build(batches)
+                batches = {}
+                batched.clear()
+            if record is None:
+                self.__drop(key)
+                continue
+            cls = record.get("__class__")
+            if cls not in classes:
+                continue
+            if obj is not None and not same:
+                updated_at = record.get("updated_at")
+                if type(updated_at) is str:
+                    updated_at = parse_time(updated_at)
+                if updated_at == getattr(obj, "updated_at", None):
+                    continue
+            batched.add(key)
+            batch = batches.get(cls)
+            if batch is None:
+                batch = batches[cls] = ([], [])
+            batch[0].append(key)
+            batch[1].append(record)
+        self.__build(batches)
+
+    def __build(self, batches):
+        """stores the objects built from the {class name: (keys, records)}
+        batches"""
+        for cls, (keys, records) in batches.items():
+            self.__put_many(cls, keys,
+                            classes[cls].from_dicts(records, stored=True))
+
+    def __load(self, name=None, progress=None):
+        """applies the records of the file holding class name that changed
+        since the last load or save, dropping the keys another writer
+        removed
+
+        Records are applied as they are decoded, __batch_size at a time,
+        so those read before the file turns out to be corrupt stay
+        applied. A corrupt file is not read again until it changes, and
+        the next save() rewrites it.
+        """
+        self.__loaded.add(name)
+        sig = self.__snapshot.stat(name)
+        stats = self.__load_stats
+        every = self.__progress_every
+        gone = set(self.__stored(name))
         try:
-            with open(self.__file_path, 'r') as f:
-                jo = json.load(f)
-            for key in jo:
-                self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
-        except:
-            pass
+            records = self.__snapshot.iter_read(name)
+            while True:
+                size = every - stats.get("records", 0) % every
+                batch = list(islice(records, min(size, self.__batch_size)))
+                if not batch:
+                    break
+                if gone:
+                    gone.difference_update(key for key, record in batch)
+                self.__apply(batch)
+                stats["records"] = stats.get("records", 0) + len(batch)
+                if progress is not None and stats["records"] % every == 0:
+                    progress(self.__measure(stats))
+        except (OSError, ValueError, EOFError, TypeError):
+            self.__sigs[name] = sig
+            if sig is not None:
+                self.__dirty.add(name)
+            return
+        self.__apply((key, None) for key in gone)
+        self.__sigs[name] = sig
+        stats["bytes"] = stats.get("bytes", 0) + sig[1]
+
+    def __ensure(self, name, materialize=False):
+        """loads the file of class name on first use of a sharded snapshot,
+        and with materialize, decodes all its objects from an indexed one"""
+        if self.__records is not None:
+            if materialize and name not in self.__loaded:
+                for key in list(self.__keys(name)):
+                    self.__materialize(key)
+                self.__loaded.add(name)
+        elif self.__snapshot.sharded and name not in self.__loaded:
+            self.__load(name)
+            if self.__journal is not None:
+                self.__replay_journal(0)
+
+    def __replay_journal(self, offset):
+        """applies the journal records written after byte offset"""
+        self.__apply(self.__journal.replay(offset), same=True)
+        FileStorage.__journal_pos = self.__journal.offset
+
+    def __units(self):
+        """returns the class names of the files loaded so far, or [None]
+        for the whole-file snapshot"""
+        if self.__snapshot.sharded:
+            return [name for name in self.__loaded if name is not None]
+        return [None]
+
+    def reload(self, progress=None):
+        """deserializes the JSON files, then the journal, to __objects
+
+        Classes of a sharded snapshot that were not loaded yet stay on
+        disk until first used. progress is called every __progress_every
+        records read from the JSON files with the statistics so far.
+        """
+        with self.__lock, self.__disk_lock():
+            FileStorage.__load_stats = {"records": 0, "bytes": 0,
+                                        "started": time.time()}
+            if self.__records is not None:
+                self.__load_records()
+            else:
+                for name in self.__units():
+                    self.__load(name, progress)
+            if self.__journal is not None:
+                self.__replay_journal(0)
+            self.__measure(self.__load_stats)
+
+    def __measure(self, stats):
+        """updates the elapsed time and peak memory of load statistics,
+        returning a copy of them"""
+        stats["seconds"] = time.time() - stats["started"]
+        if resource is not None:
+            stats["peak_rss_kb"] = \
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {k: v for k, v in stats.items() if k != "started"}
+
+    def stats(self):
+        """returns the number of objects in memory and the statistics of
+        the last reload(): records and bytes read, seconds taken and the
+        peak resident memory of the process in KiB, and the interned ids
+        the objects refer to each other by"""
+        load = {k: v for k, v in self.__load_stats.items()
+                if k != "started"}
+        return {"objects": len(self.__objects), "load": load,
+                "interned": references.stats(self.__objects.values())}
 
     def delete(self, obj=None):
         """delete obj from __objects if it’s inside"""
         if obj is not None:
-            del self.__objects[obj.__class__.__name__ + '.' + obj.id]
-            self.save()
+            self.delete_many((obj,))
+
+    def delete_many(self, objs, chunk_size=1000):
+        """deletes each of objs from __objects, taking the lock once per
+        chunk of chunk_size objects"""
+        objs = iter(objs)
+        for chunk in iter(lambda: list(islice(objs, chunk_size)), []):
+            with self.__lock:
+                for obj in chunk:
+                    name = obj.__class__.__name__
+                    key = name + '.' + obj.id
+                    self.__drop(key)
+                    self.__dirty.add(name)
+                    if self.__journal is not None:
+                        self.__pending[key] = None
 
     def close(self):
-        """Deserialize JSON file to objects"""
-        self.reload()
+        """Deserialize to objects what changed in the JSON files and journal
+
+        Nothing is read when no file changed since the last load or save,
+        and only the journal tail when the JSON files are unchanged.
+        """
+        with self.__lock, self.__disk_lock():
+            self.__refresh()
+
+    def __refresh(self):
+        """applies what changed in the JSON files and journal since the
+        last load or save"""
+        if self.__records is not None:
+            changed = self.__records.stat() != self.__sigs.get(None)
+            if changed:
+                self.__load_records()
+        else:
+            changed = [name for name in self.__units()
+                       if self.__snapshot.stat(name) != self.__sigs.get(name)]
+            for name in changed:
+                self.__load(name)
+        if self.__journal is None:
+            return
+        if changed:
+            self.__replay_journal(0)
+        elif self.__journal.size() != self.__journal_pos:
+            self.__replay_journal(self.__journal_pos)
+
+    def __disk_lock(self, exclusive=False):
+        """returns a context holding the lock shared with other processes,
+        if there is one"""
+        if self.__shared is None:
+            return nullcontext()
+        if exclusive:
+            return self.__shared.exclusive()
+        return self.__shared.shared()
 
-    def get(self, cls, id):
-        """Retrieve an object"""
-        if cls is not None and type(cls) is str and id is not None and\
+    def get(self, cls, id, profile=None):
+        """Retrieve an object (profile: see all())"""
+        if cls is not None and type(cls) != str:
+            cls = cls.__name__
+        if cls is not None and id is not None and\
            type(id) is str and cls in classes:
-            key = cls + '.' + id
-            obj = self.__objects.get(key, None)
-            return obj
+            with self.__lock:
+                self.__ensure(cls)
+                return self.__materialize(cls + '.' + id)
         else:
             return None
 
+    def get_many(self, cls, ids, profile=None):
+        """returns a dictionary of the objects of cls found among ids, by
+        id (profile: see all())"""
+        if cls is not None and type(cls) != str:
+            cls = cls.__name__
+        objs = {}
+        if cls not in classes:
+            return objs
+        with self.__lock:
+            self.__ensure(cls)
+            for id in ids:
+                if type(id) is str:
+                    obj = self.__materialize(cls + '.' + id)
+                    if obj is not None:
+                        objs[id] = obj
+        return objs
+
     def count(self, cls=None):
         """Count number of objects in storage"""
         total = 0
-        if type(cls) == str and cls in classes:
+        if cls is not None and type(cls) != str:
+            cls = cls.__name__
+        if self.__records is not None:
+            for name in classes:
+                if cls is None or cls == name:
+                    total += self.__records.count(name + ".") - \
+                        len(self.__deleted.get(name, ())) + \
+                        len(self.__extra.get(name, ()))
+        elif type(cls) == str and cls in classes:
             total = len(self.all(cls))
         elif cls is None:
-            total = len(self.__objects)
+            total = len(self.all())
         return total
+
+
+if models.storage_t != "db":
+    BaseModel._moved = FileStorage().reindex
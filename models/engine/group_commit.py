@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""
+Contains the GroupCommit class used by FileStorage to batch its writes
+"""
+
+import atexit
+import threading
+import time
+
+
+class GroupCommit:
+    """background writer turning the save requests made within window
+    seconds of each other into a single call of flush
+
+    Requests are numbered; barrier() blocks until every request made
+    before it is covered by a completed flush, flushing in the calling
+    thread rather than waiting for the window to end. An exception raised
+    by a background flush is raised again by the next barrier().
+    """
+
+    def __init__(self, flush, window):
+        """initializes the writer of the flush callable"""
+        self.window = window
+        self.requests = 0
+        self.flushes = 0
+        self.__flush = flush
+        self.__cond = threading.Condition()
+        self.__flush_lock = threading.Lock()
+        self.__done = 0
+        self.__error = None
+        self.__thread = None
+
+    def request(self):
+        """asks for a flush within window seconds and returns at once"""
+        with self.__cond:
+            self.requests += 1
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run,
+                                                 daemon=True)
+                self.__thread.start()
+                atexit.register(self.barrier)
+            self.__cond.notify_all()
+
+    def barrier(self):
+        """returns once every request made so far has been flushed"""
+        self.__flush_pending()
+        with self.__cond:
+            error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def __flush_pending(self):
+        """flushes if some request is not covered by a flush yet"""
+        with self.__flush_lock:
+            with self.__cond:
+                target = self.requests
+                if self.__done >= target:
+                    return
+            try:
+                self.__flush()
+            finally:
+                with self.__cond:
+                    self.__done = target
+                    self.flushes += 1
+                    self.__cond.notify_all()
+
+    def __run(self):
+        """waits for requests and flushes window seconds after the first"""
+        while True:
+            with self.__cond:
+                while self.__done >= self.requests:
+                    self.__cond.wait()
+            time.sleep(self.window)
+            try:
+                self.__flush_pending()
+            except Exception as error:
+                with self.__cond:
+                    self.__error = error
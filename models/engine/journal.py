@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Contains the Journal class used by FileStorage's append-only mode
+"""
+
+import json
+import os
+
+
+class Journal:
+    """append-only log of object changes, one JSON record per line
+
+    A record is {"key": "<class name>.<id>", "obj": <to_dict() or null>},
+    where a null obj means the key was deleted.
+    """
+
+    def __init__(self, path):
+        """initializes the journal for the log file at path"""
+        self.path = path
+        self.offset = 0
+
+    def append(self, records):
+        """appends (key, dict or None) pairs to the log in one write"""
+        lines = [json.dumps({"key": key, "obj": obj}) + "\n"
+                 for key, obj in records]
+        if not lines:
+            return
+        with open(self.path, 'a') as f:
+            f.write("".join(lines))
+            f.flush()
+
+    def replay(self, offset=0):
+        """yields the (key, dict or None) pairs stored in the log
+
+        Reading starts at byte offset and self.offset is left just past the
+        last complete record. Replay stops at the first unreadable line,
+        which is what a write interrupted half way leaves at the end.
+        """
+        self.offset = offset
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return
+        with f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                self.offset += len(line)
+                yield record["key"], record["obj"]
+
+    def size(self):
+        """returns the size of the log in bytes"""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def truncate(self):
+        """empties the log once its records are part of a snapshot"""
+        open(self.path, 'w').close()
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""
+Contains the LazyStorage class models.storage starts as
+"""
+
+import threading
+
+
+class LazyStorage:
+    """stand-in for the storage engine that creates it on first use
+
+    create is called once, on the first attribute looked up, and must
+    return the loaded engine; every attribute then comes from it.
+    close() before that does nothing, so that tearing down a request
+    which never used the storage does not load it.
+    """
+
+    def __init__(self, create):
+        """initializes the stand-in for the engine create returns"""
+        self.__create = create
+        self.__engine = None
+        self.__lock = threading.Lock()
+
+    def engine(self):
+        """returns the engine, creating it if it does not exist yet"""
+        if self.__engine is None:
+            with self.__lock:
+                if self.__engine is None:
+                    self.__engine = self.__create()
+        return self.__engine
+
+    def loaded(self):
+        """returns True if the engine was created"""
+        return self.__engine is not None
+
+    def close(self):
+        """closes the engine if it was created"""
+        if self.__engine is not None:
+            self.__engine.close()
+
+    def __getattr__(self, name):
+        """returns the attribute name of the engine"""
+        return getattr(self.engine(), name)
@@ -0,0 +1,209 @@
+#!/usr/bin/python3
+"""
+Contains the RecordFile class used by FileStorage's indexed format
+"""
+
+import marshal
+import mmap
+import os
+import shutil
+import struct
+
+
+class RecordFile:
+    """memory-mapped file of records that can be decoded one at a time
+
+    The file is a header, the records one after the other (each a
+    marshal-encoded dict), the keys, then an index of fixed-size (key
+    offset, key length, record offset, record length) entries sorted by
+    key. Looking a key up is a binary search over the mapped index, so
+    opening the file reads nothing but the header, and only the records
+    asked for are ever decoded. Keys of a class are contiguous in the
+    index since they share a prefix, and may be of any length. Files of
+    version 1, whose entries held keys of up to 80 bytes, are still read.
+    """
+
+    MAGIC = b"HBRF"
+    VERSION = 2
+    MARSHAL_VERSION = 4
+    magic = struct.Struct("<4sH")
+    header = struct.Struct("<4sHxxQQQ")
+    entry = struct.Struct("<QIQI")
+    header_v1 = struct.Struct("<4sHxxQQ")
+    entry_v1 = struct.Struct("<80sQI")
+
+    def __init__(self, path):
+        """initializes the record file stored at path, without opening it"""
+        self.path = path
+        self.__map = None
+        self.__count = 0
+        self.__keys = None
+        self.__index = 0
+
+    def open(self):
+        """maps the current version of the file, which may be missing"""
+        self.close()
+        try:
+            with open(self.path, 'rb') as f:
+                self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        magic, version = self.magic.unpack_from(self.__map)
+        if magic != self.MAGIC or version not in (1, self.VERSION):
+            self.close()
+            raise ValueError("unsupported record file format")
+        if version == 1:
+            self.__keys = None
+            _, _, self.__count, self.__index = \
+                self.header_v1.unpack_from(self.__map)
+        else:
+            _, _, self.__count, self.__keys, self.__index = \
+                self.header.unpack_from(self.__map)
+
+    def close(self):
+        """unmaps the file"""
+        if self.__map is not None:
+            self.__map.close()
+        self.__map = None
+        self.__count = 0
+        self.__keys = None
+
+    def stat(self):
+        """returns what identifies the current version of the file"""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def __len__(self):
+        """returns the number of records"""
+        return self.__count
+
+    def __getitem__(self, i):
+        """returns the (key, offset, length) of the i-th index entry"""
+        if self.__keys is None:
+            key, offset, length = self.entry_v1.unpack_from(
+                self.__map, self.__index + i * self.entry_v1.size)
+            return key.rstrip(b"\0").decode("utf-8"), offset, length
+        start, size, offset, length = self.entry.unpack_from(
+            self.__map, self.__index + i * self.entry.size)
+        start += self.__keys
+        return self.__map[start:start + size].decode("utf-8"), offset, length
+
+    def __bisect(self, key, lo=0):
+        """returns the number of the first index entry not less than key"""
+        hi = self.__count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self[mid][0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def __find(self, key):
+        """returns the index entry of key, or None"""
+        i = self.__bisect(key)
+        if i < self.__count:
+            entry = self[i]
+            if entry[0] == key:
+                return entry
+        return None
+
+    def __contains__(self, key):
+        """returns True if the file holds a record for key"""
+        return self.__find(key) is not None
+
+    def __range(self, prefix):
+        """returns the index entry numbers of the keys starting with prefix"""
+        start = self.__bisect(prefix)
+        end = self.__bisect(prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+        return range(start, end)
+
+    def keys(self, prefix=""):
+        """yields, in order, the keys starting with prefix"""
+        entries = self.__range(prefix) if prefix else range(self.__count)
+        for i in entries:
+            yield self[i][0]
+
+    def count(self, prefix=""):
+        """returns the number of keys starting with prefix"""
+        if not prefix:
+            return self.__count
+        return len(self.__range(prefix))
+
+    def raw(self, key):
+        """returns the encoded record of key, or None"""
+        entry = self.__find(key)
+        if entry is None:
+            return None
+        return self.__map[entry[1]:entry[1] + entry[2]]
+
+    def get(self, key):
+        """returns the record of key decoded to a dict, or None"""
+        data = self.raw(key)
+        if data is None:
+            return None
+        return marshal.loads(data)
+
+    @classmethod
+    def encode(cls, record):
+        """returns a dict encoded the way records are stored"""
+        return marshal.dumps(record, cls.MARSHAL_VERSION)
+
+    def __write(self, f, keys, idx, records):
+        """writes the header and records to f, their keys to keys and
+        their index entries to idx, and returns the number of records and
+        the offset of the keys"""
+        f.write(self.header.pack(self.MAGIC, self.VERSION, 0, 0, 0))
+        offset = self.header.size
+        start = 0
+        count = 0
+        previous = None
+        for key, data in records:
+            if previous is not None and key <= previous:
+                raise ValueError("keys out of order: {} after {}"
+                                 .format(key, previous))
+            previous = key
+            key = key.encode("utf-8")
+            f.write(data)
+            keys.write(key)
+            idx.write(self.entry.pack(start, len(key), offset, len(data)))
+            start += len(key)
+            offset += len(data)
+            count += 1
+        return count, offset
+
+    def write(self, records):
+        """replaces the file with the (key, encoded record) pairs given in
+        key order, through a temporary file, and maps the new version
+
+        Records are written as they come, and their keys and index
+        entries go to two more temporary files appended at the end, so
+        that writing holds one record at a time in memory.
+        """
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'wb') as f, \
+                    open(tmp_path + ".keys", 'w+b') as keys, \
+                    open(tmp_path + ".idx", 'w+b') as idx:
+                count, offset = self.__write(f, keys, idx, records)
+                keys.seek(0)
+                shutil.copyfileobj(keys, f)
+                index = f.tell()
+                idx.seek(0)
+                shutil.copyfileobj(idx, f)
+                f.seek(0)
+                f.write(self.header.pack(self.MAGIC, self.VERSION, count,
+                                         offset, index))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            for part in (".keys", ".idx"):
+                if os.path.exists(tmp_path + part):
+                    os.remove(tmp_path + part)
+        os.replace(tmp_path, self.path)
+        self.open()
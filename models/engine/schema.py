@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+"""
+Contains the schema migrations of the database of DBStorage
+
+The tables are created from the model metadata by DBStorage.reload(),
+but create_all() leaves existing tables as they are: migrations brings
+an existing database up to date with it. The versions applied are
+recorded in the schema_migrations table, and each migration checks the
+database before changing it, so that running them again, or on a
+database created with the current models, changes nothing.
+
+Usage: HBNB_TYPE_STORAGE=db python3 -m models.engine.schema [migrate|check]
+migrate applies the pending migrations, and check prints whether the
+queries of the nested list endpoints and of places_search use an index
+on the column they filter on, according to EXPLAIN.
+"""
+
+from datetime import datetime
+import re
+import sys
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table
+from sqlalchemy import inspect, select, text
+
+history = MetaData()
+schema_migrations = Table("schema_migrations", history,
+                          Column("version", Integer, primary_key=True),
+                          Column("description", String(128)),
+                          Column("applied_at", DateTime))
+
+
+def indexes_of(inspector, table):
+    """returns the column names of the indexes of table, by index name,
+    with its primary key as PRIMARY"""
+    indexes = {index["name"]: index["column_names"]
+               for index in inspector.get_indexes(table)}
+    primary = inspector.get_pk_constraint(table)["constrained_columns"]
+    if primary:
+        indexes["PRIMARY"] = primary
+    return indexes
+
+
+def create_indexes(connection):
+    """creates the indexes of the model metadata missing from the
+    tables
+
+    An index is missing unless one of the same name exists, or one whose
+    leading columns are its columns: InnoDB indexes every foreign key
+    column itself, under the name of the constraint.
+    """
+    from models.base_model import Base
+    inspector = inspect(connection)
+    tables = inspector.get_table_names()
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        existing = indexes_of(inspector, table.name)
+        for index in table.indexes:
+            columns = [column.name for column in index.columns]
+            if index.name not in existing and \
+               not any(names[:len(columns)] == columns
+                       for names in existing.values()):
+                index.create(connection)
+
+
+migrations = [
+    (1, "secondary indexes on foreign keys and search columns",
+     create_indexes)
+]
+
+
+def applied(connection):
+    """returns the set of the versions applied to the database"""
+    history.create_all(connection)
+    return set(connection.execute(select(schema_migrations.c.version))
+               .scalars())
+
+
+def migrate(engine):
+    """applies the migrations not applied yet to the database of engine,
+    each in its own transaction, and returns their versions"""
+    versions = []
+    for version, description, apply in migrations:
+        with engine.begin() as connection:
+            if version in applied(connection):
+                continue
+            apply(connection)
+            connection.execute(schema_migrations.insert().values(
+                version=version, description=description,
+                applied_at=datetime.utcnow()))
+        versions.append(version)
+    return versions
+
+
+def queries():
+    """returns the hot queries to check, by name, with the column the
+    index each should use starts with"""
+    from models.city import City
+    from models.place import Place, place_amenity
+    from models.review import Review
+    return {
+        "cities of a state": (select(City).where(City.state_id == "x"),
+                              City.__table__.c.state_id),
+        "places of a city": (select(Place).where(Place.city_id == "x"),
+                             Place.__table__.c.city_id),
+        "reviews of a place": (select(Review)
+                               .where(Review.place_id == "x"),
+                               Review.__table__.c.place_id),
+        "places of an amenity": (select(place_amenity.c.place_id).where(
+            place_amenity.c.amenity_id == "x"),
+            place_amenity.c.amenity_id),
+        "places by price": (select(Place).where(
+            Place.price_by_night.between(50, 100)),
+            Place.__table__.c.price_by_night)
+    }
+
+
+def explain(connection, query):
+    """returns the names of the indexes the database plans to use for
+    query"""
+    sql = str(query.compile(connection, compile_kwargs={
+        "literal_binds": True}))
+    if connection.dialect.name == "sqlite":
+        plan = connection.execute(text("EXPLAIN QUERY PLAN " + sql))
+        return {match.group(1) for row in plan for match in
+                [re.search(r"USING (?:COVERING )?INDEX (\w+)", row[-1])]
+                if match}
+    plan = connection.execute(text("EXPLAIN " + sql)).mappings()
+    return {row["key"] for row in plan if row["key"]}
+
+
+def check(engine):
+    """returns, for each hot query, the table.column its index should
+    start with, the indexes EXPLAIN shows it using, and whether one of
+    them, whatever its name, starts with that column
+
+    MySQL may prefer a full scan of tables holding a few rows: check a
+    database holding representative data.
+    """
+    results = {}
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        for name, (query, column) in queries().items():
+            used = explain(connection, query)
+            indexes = indexes_of(inspector, column.table.name)
+            ok = any((indexes.get(index) or [None])[0] == column.name
+                     for index in used)
+            results[name] = (column.table.name + "." + column.name,
+                             sorted(used), ok)
+    return results
+
+
+if __name__ == "__main__":
+    from models import warm_up
+    storage = warm_up()
+    if sys.argv[1:] == ["check"]:
+        failed = 0
+        for name, (index, used, ok) in storage.check_indexes().items():
+            print("{:<22} {:<30} {}".format(name, index, "ok" if ok else
+                                            "NOT USED: " + ", ".join(used)))
+            failed += not ok
+        sys.exit(1 if failed else 0)
+    versions = storage.migrate()
+    print("applied: " + (", ".join(map(str, versions)) or "nothing"))
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Contains the Snapshot class used by FileStorage to read and write its files
+"""
+
+from models.engine.codec import BinaryCodec, codecs, detect
+import os
+
+
+class Snapshot:
+    """full copy of the stored records, as one file or one per class
+
+    A sharded snapshot is a directory holding <class name>.json (or .bin)
+    for each class, so that a class can be read or written without the
+    others. Methods take the class name to work on; the whole-file
+    snapshot ignores it.
+
+    Files are written with the codec named codec and read with whichever
+    codec wrote them, so switching codecs needs no conversion step.
+    """
+
+    def __init__(self, path, sharded=False, codec="json"):
+        """initializes the snapshot stored at path"""
+        self.path = path
+        self.sharded = sharded
+        self.codec = codecs[codec]
+
+    def unit(self, name):
+        """returns the shard holding class name, None for the whole file"""
+        return name if self.sharded else None
+
+    def file_path(self, name=None):
+        """returns the path of the file holding class name"""
+        if self.unit(name) is None:
+            return self.path
+        return os.path.join(self.path, name + self.codec.extension)
+
+    def stat(self, name=None):
+        """returns what identifies the current version of a file"""
+        try:
+            st = os.stat(self.file_path(name))
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def iter_read(self, name=None):
+        """yields the (key, dict) records of a file one at a time
+
+        Raises OSError when the file cannot be opened, and ValueError,
+        EOFError or TypeError when it turns out to be corrupt.
+        """
+        with open(self.file_path(name), 'rb') as f:
+            codec = detect(f.read(len(BinaryCodec.MAGIC)))
+            f.seek(0)
+            yield from codec.iterload(f)
+
+    def write(self, records, name=None):
+        """replaces the records of a file through a temporary file"""
+        path = self.file_path(name)
+        if self.unit(name) is not None:
+            os.makedirs(self.path, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self.codec.dumps(records))
+        os.replace(tmp_path, path)
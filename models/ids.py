@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+"""
+Contains the id generators BaseModel can give new instances
+
+HBNB_ID_SCHEME selects the generator new_id is: uuid4 (random, the
+default) or uuid7, whose ids start with their creation time so that
+rows are inserted in primary key order. Both give 36-character UUID
+strings, so ids of either scheme can live side by side.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+
+def uuid4():
+    """returns a random UUID string"""
+    return str(uuid.uuid4())
+
+
+class UUID7:
+    """generator of time-ordered UUID strings (version 7, RFC 9562)
+
+    An id holds the Unix time in milliseconds in its first 48 bits, then
+    a 12-bit sequence and 62 random bits. The sequence starts at a
+    random value in its lower half each millisecond and is incremented
+    for each id generated within it, so ids from one process sort in
+    the order they were generated; when it runs out, the timestamp is
+    moved one millisecond ahead.
+    """
+
+    def __init__(self):
+        """initializes the generator"""
+        self.__last = 0
+        self.__seq = 0
+        self.__lock = threading.Lock()
+
+    def __call__(self):
+        """returns a new id"""
+        ms = time.time_ns() // 1000000
+        with self.__lock:
+            if ms > self.__last:
+                self.__last = ms
+                self.__seq = int.from_bytes(os.urandom(2), "big") & 0x7ff
+            else:
+                self.__seq += 1
+                if self.__seq > 0xfff:
+                    self.__last += 1
+                    self.__seq = 0
+            ms, seq = self.__last, self.__seq
+        rand = int.from_bytes(os.urandom(8), "big") & (1 << 62) - 1
+        return str(uuid.UUID(int=ms << 80 | 7 << 76 | seq << 64 |
+                             2 << 62 | rand))
+
+
+generators = {"uuid4": uuid4, "uuid7": UUID7()}
+new_id = generators[os.getenv("HBNB_ID_SCHEME", "uuid4")]
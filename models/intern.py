@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+"""
+Contains the InternTable class and references, the table BaseModel
+shares the ids held by reference attributes (city_id, user_id, ...)
+through in file mode
+"""
+
+import models
+import sys
+
+
+class InternTable:
+    """table of shared copies of strings
+
+    intern() returns the copy of a string sys.intern() keeps, if any, so
+    that equal strings read or received separately end up as one object
+    and the others can be freed. The interpreter drops a copy once no
+    object refers to it, so the table never outgrows the objects in
+    memory. A disabled table returns values as they are.
+    """
+
+    def __init__(self, enabled=True):
+        """initializes a table, interning strings if enabled"""
+        self.enabled = enabled
+
+    def intern(self, value):
+        """returns value with the strings it holds, itself or the items
+        of a list, replaced by their shared copy"""
+        if not self.enabled:
+            return value
+        if type(value) is str:
+            return sys.intern(value)
+        if type(value) is list:
+            return [sys.intern(v) if type(v) is str else v for v in value]
+        return value
+
+    def stats(self, objs):
+        """returns the number of distinct non-empty ids held by the
+        reference attributes of objs, and of bytes saved by objs sharing
+        those ids"""
+        total = 0
+        sizes = {}
+        for obj in objs:
+            for name in obj._references:
+                value = getattr(obj, name, None)
+                for v in value if type(value) is list else (value,):
+                    if type(v) is str and v:
+                        sizes[id(v)] = size = sys.getsizeof(v)
+                        total += size
+        return {"bytes_saved": total - sum(sizes.values()),
+                "distinct": len(sizes)}
+
+
+references = InternTable(enabled=models.storage_t != "db")
@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+"""
+Contains the PasswordHasher class and hasher, the service User hashes
+and checks passwords with
+
+Passwords are hashed with scrypt, a deliberately slow and memory-hard
+key derivation function, into strings of the form
+scrypt$<log2 n>$<r>$<p>$<base64 salt>$<base64 key>. HBNB_PASSWORD_COST
+sets log2 n (default 14: 16 MiB and about 50 ms per hash).
+
+Each hash is computed by the thread asking for it: hashlib releases the
+GIL while deriving a key, so a request hashing a password does not hold
+up the threads serving the others. No more than HBNB_PASSWORD_WORKERS
+hashes (default: one per CPU) run at once, and at most
+HBNB_PASSWORD_QUEUE more (default: 16 per worker) can wait for their
+turn; beyond that, Overloaded is raised rather than letting the wait
+grow.
+
+The md5 hex digests stored before scrypt are still accepted, and are
+reported as outdated, like hashes of a lower cost than the current one,
+so that they are replaced the next time the password is checked.
+"""
+
+import base64
+import hashlib
+import hmac
+from os import cpu_count, getenv, urandom
+import re
+import threading
+import time
+
+legacy = re.compile("[0-9a-f]{32}")
+
+
+class Overloaded(Exception):
+    """raised when too many passwords are waiting to be hashed"""
+
+
+class PasswordHasher:
+    """hashes and checks passwords in the calling thread, a bounded
+    number at a time
+
+    stats() reports the keys derived, the seconds spent deriving them and
+    the keys derived per such second, the hashes waiting or running, and
+    the requests rejected as Overloaded. workers is the number of hashes
+    that may run at once, not a pool of threads.
+    """
+    r = 8
+    p = 1
+
+    def __init__(self, cost=14, workers=None, queue=None):
+        """initializes a hasher of the given cost"""
+        self.cost = cost
+        self.workers = workers or cpu_count() or 1
+        self.queue = 16 * self.workers if queue is None or queue < 0 \
+            else queue
+        self.__lock = threading.Lock()
+        self.__running = threading.BoundedSemaphore(self.workers)
+        self.__free = threading.BoundedSemaphore(self.workers + self.queue)
+        self.__pending = 0
+        self.__derived = 0
+        self.__seconds = 0.0
+        self.__rejected = 0
+
+    def __derive(self, password, salt, cost, r, p):
+        """returns the scrypt key of password, derived in this thread once
+        fewer than workers keys are being derived, or raises Overloaded"""
+        if not self.__free.acquire(blocking=False):
+            with self.__lock:
+                self.__rejected += 1
+            raise Overloaded("{:d} passwords are waiting to be hashed"
+                             .format(self.queue))
+        with self.__lock:
+            self.__pending += 1
+        try:
+            with self.__running:
+                start = time.perf_counter()
+                key = hashlib.scrypt(password.encode("utf-8"), salt=salt,
+                                     n=1 << cost, r=r, p=p,
+                                     maxmem=256 * r * (1 << cost) + (1 << 20))
+                with self.__lock:
+                    self.__derived += 1
+                    self.__seconds += time.perf_counter() - start
+            return key
+        finally:
+            with self.__lock:
+                self.__pending -= 1
+            self.__free.release()
+
+    def hash(self, password):
+        """returns the hash of password at the current cost"""
+        salt = urandom(16)
+        key = self.__derive(password, salt, self.cost, self.r, self.p)
+        return "$".join(["scrypt", str(self.cost), str(self.r), str(self.p),
+                         base64.b64encode(salt).decode("ascii"),
+                         base64.b64encode(key).decode("ascii")])
+
+    def check(self, password, hashed):
+        """returns whether hashed is the hash of password"""
+        if type(password) is not str or not self.is_hash(hashed):
+            return False
+        if legacy.fullmatch(hashed):
+            key = hashlib.md5(password.encode("utf-8")).hexdigest()
+            return hmac.compare_digest(key, hashed)
+        cost, r, p, salt, key = hashed.split("$")[1:]
+        derived = self.__derive(password, base64.b64decode(salt),
+                                int(cost), int(r), int(p))
+        return hmac.compare_digest(derived, base64.b64decode(key))
+
+    def outdated(self, hashed):
+        """returns whether hashed should be replaced by a hash at the
+        current cost"""
+        return legacy.fullmatch(hashed) is not None or \
+            hashed.split("$")[1:4] != [str(self.cost), str(self.r),
+                                       str(self.p)]
+
+    @staticmethod
+    def is_hash(value):
+        """returns whether value is a hash rather than a password"""
+        if type(value) is not str:
+            return False
+        return legacy.fullmatch(value) is not None or \
+            (value.startswith("scrypt$") and value.count("$") == 5)
+
+    def stats(self):
+        """returns the statistics of the hasher"""
+        with self.__lock:
+            return {"workers": self.workers, "cost": self.cost,
+                    "pending": self.__pending, "derived": self.__derived,
+                    "seconds": self.__seconds, "per_second":
+                    self.__derived / self.__seconds if self.__seconds else 0,
+                    "rejected": self.__rejected}
+
+
+hasher = PasswordHasher(int(getenv("HBNB_PASSWORD_COST", "14")),
+                        int(getenv("HBNB_PASSWORD_WORKERS", "0")) or None,
+                        int(getenv("HBNB_PASSWORD_QUEUE", "-1")))
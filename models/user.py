@@ -2,15 +2,21 @@
 """ holds class User"""
 import models
 from models.base_model import BaseModel, Base
+from models.passwords import hasher
 from os import getenv
 import sqlalchemy
 from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship
-import hashlib
 
 
 class User(BaseModel, Base):
-    """Representation of a user """
+    """Representation of a user
+
+    Passwords given to __init__ or set as password are always replaced by
+    their hash from models.passwords.hasher, even if they look like one:
+    only from_dicts(records, stored=True), which storage reloads with,
+    keeps the hashes of the records as they are.
+    """
     if models.storage_t == 'db':
         __tablename__ = 'users'
         email = Column(String(128), nullable=False)
@@ -25,13 +31,64 @@ class User(BaseModel, Base):
         first_name = ""
         last_name = ""
 
+    _plain_init = False
+
     def __init__(self, *args, **kwargs):
         """initializes user"""
         if kwargs:
             if 'password' in kwargs:
-                pw = kwargs['password']
-                encoding = 'utf-8'
-                pw_hashed = hashlib.md5(pw.encode(encoding)).hexdigest()
-                kwargs.update({'password': pw_hashed})
+                kwargs['password'] = self.hashed(kwargs['password'])
 
         super().__init__(*args, **kwargs)
+
+    def __setattr__(self, name, value):
+        """sets an attribute, hashing it if it is a new password"""
+        if name == 'password':
+            value = self.hashed(value)
+        super().__setattr__(name, value)
+
+    @classmethod
+    def from_dicts(cls, records, stored=False):
+        """returns a list of users, one per dict of keyword arguments for
+        __init__ in records, keeping their passwords as they are, and
+        returning them clean, if they were stored"""
+        if not stored:
+            return super().from_dicts(records)
+        users = []
+        for record in records:
+            user = cls(**{k: v for k, v in record.items() if k != 'password'})
+            if 'password' in record:
+                BaseModel.__setattr__(user, 'password', record['password'])
+            user.clean()
+            users.append(user)
+        return users
+
+    @staticmethod
+    def hashed(password):
+        """returns the hash of password"""
+        if type(password) is not str:
+            return password
+        return hasher.hash(password)
+
+    def check_password(self, password):
+        """returns whether password is the user's, replacing its hash in
+        memory by one at the current cost if it is outdated: the user is
+        then dirty, for the caller to save"""
+        if not hasher.check(password, self.password):
+            return False
+        if hasher.outdated(self.password):
+            self.password = password
+        return True
+
+    if models.storage_t != 'db':
+        @property
+        def places(self):
+            """getter for list of place instances owned by the user"""
+            from models.place import Place
+            return models.storage.related(Place, "user_id", self.id)
+
+        @property
+        def reviews(self):
+            """getter for list of review instances written by the user"""
+            from models.review import Review
+            return models.storage.related(Review, "user_id", self.id)
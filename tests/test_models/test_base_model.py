@@ -2,8 +2,12 @@
 """Test BaseModel for expected behavior and documentation"""
 from datetime import datetime
 import inspect
+import json
 import models
+import os
 import pep8 as pycodestyle
+import subprocess
+import sys
 import time
 import unittest
 from unittest import mock
@@ -158,3 +162,88 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(old_created_at, new_created_at)
         self.assertTrue(mock_storage.new.called)
         self.assertTrue(mock_storage.save.called)
+
+    def test_from_dicts(self):
+        """Test that from_dicts builds the instances __init__ would"""
+        records = [BaseModel(name="a").to_dict(), {"name": "b"}, {}]
+        objs = BaseModel.from_dicts(records)
+        self.assertEqual(len(objs), 3)
+        self.assertEqual(objs[0].__dict__,
+                         BaseModel(**records[0]).__dict__)
+        self.assertIs(type(objs[1].created_at), datetime)
+        self.assertIs(type(objs[1].id), str)
+        self.assertEqual(objs[1].name, "b")
+        self.assertNotEqual(objs[1].id, objs[2].id)
+        self.assertTrue(all(obj.dirty for obj in objs))
+
+    def test_parse_time(self):
+        """Test that stored and legacy date strings are both parsed"""
+        parse_time = models.base_model.parse_time
+        self.assertEqual(parse_time("2017-09-28T21:03:54.052298"),
+                         datetime(2017, 9, 28, 21, 3, 54, 52298))
+        self.assertEqual(parse_time("2017-09-28T21:03:54.5"),
+                         datetime(2017, 9, 28, 21, 3, 54, 500000))
+        with self.assertRaises(ValueError):
+            parse_time("28/09/2017")
+        inst = BaseModel(created_at="2017-09-28T21:03:54.052298")
+        self.assertEqual(inst.created_at,
+                         datetime(2017, 9, 28, 21, 3, 54, 52298))
+
+    def test_to_dict_cache(self):
+        """Test that to_dict returns fresh copies of a memoized dict that
+        follow changes to the instance"""
+        inst = BaseModel(name="Holberton")
+        first = inst.to_dict()
+        first["name"] = "changed"
+        self.assertEqual(inst.to_dict()["name"], "Holberton")
+        self.assertIsNot(inst.to_dict(), inst.to_dict())
+        inst.name = "School"
+        self.assertEqual(inst.to_dict()["name"], "School")
+        object.__setattr__(inst, "updated_at", datetime(2017, 1, 1))
+        self.assertEqual(inst.to_dict()["updated_at"],
+                         "2017-01-01T00:00:00.000000")
+        self.assertEqual(inst.to_dict()["created_at"],
+                         inst.created_at.strftime("%Y-%m-%dT%H:%M:%S.%f"))
+        inst._note = "kept"
+        self.assertEqual(inst.to_dict()["_note"], "kept")
+        del inst.name
+        self.assertNotIn("name", inst.to_dict())
+        with self.assertRaises(AttributeError):
+            del inst.name
+
+    def test_dirty(self):
+        """Test that instances track the attributes that change"""
+        inst = BaseModel(name="Holberton")
+        self.assertTrue(inst.dirty)
+        self.assertEqual(inst.changed,
+                         {"id", "created_at", "updated_at", "name"})
+        inst.clean()
+        self.assertFalse(inst.dirty)
+        inst.name = "Holberton"
+        inst._hidden = 1
+        self.assertFalse(inst.dirty)
+        inst.name = "School"
+        inst.number = 89
+        self.assertEqual(inst.changed, {"name", "number"})
+        self.assertNotIn("_BaseModel__changed", inst.__dict__)
+        self.assertNotIn("_BaseModel__changed", inst.to_dict())
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_slots(self):
+        """Test that HBNB_MODEL_SLOTS=1 instances have no __dict__ but
+        still behave like the default ones"""
+        code = ("import json\n"
+                "from models.place import Place\n"
+                "p = Place(name='Loft', note='ad hoc')\n"
+                "p.max_guest = 4\n"
+                "print(json.dumps([Place.__dictoffset__, sorted(p.to_dict()),"
+                " p.city_id, str(p) == '[Place] ({}) {}'.format(p.id,"
+                " p.__dict__)]))")
+        env = dict(os.environ, HBNB_MODEL_SLOTS="1")
+        out = subprocess.run([sys.executable, "-c", code], env=env,
+                             stdout=subprocess.PIPE, check=True).stdout
+        self.assertEqual(json.loads(out.decode()),
+                         [0, ["__class__", "created_at", "id", "max_guest",
+                              "name", "note", "updated_at"], "", True])
+        if not models.base_model.slotted:
+            self.assertNotEqual(models.place.Place.__dictoffset__, 0)
@@ -0,0 +1,164 @@
+#!/usr/bin/python3
+"""
+Contains the TestCodecDocs and TestCodec classes
+"""
+
+from datetime import datetime
+import inspect
+import io
+import json
+import marshal
+from models.engine import codec
+import os
+import pep8
+import struct
+import unittest
+JSONCodec = codec.JSONCodec
+BinaryCodec = codec.BinaryCodec
+
+
+class TestCodecDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the codecs"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.codec_f = (inspect.getmembers(JSONCodec, inspect.isfunction) +
+                       inspect.getmembers(BinaryCodec, inspect.isfunction))
+
+    def test_pep8_conformance_codec(self):
+        """Test that models/engine/codec.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/codec.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_codec(self):
+        """Test tests/test_models/test_engine/test_codec.py for PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_codec.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_codec_module_docstring(self):
+        """Test for the codec.py module docstring"""
+        self.assertIsNot(codec.__doc__, None,
+                         "codec.py needs a docstring")
+        self.assertTrue(len(codec.__doc__) >= 1,
+                        "codec.py needs a docstring")
+
+    def test_codec_class_docstrings(self):
+        """Test for the JSONCodec and BinaryCodec class docstrings"""
+        for cls in [JSONCodec, BinaryCodec]:
+            self.assertIsNot(cls.__doc__, None,
+                             "{:s} class needs a docstring".format(
+                                 cls.__name__))
+            self.assertTrue(len(cls.__doc__) >= 1,
+                            "{:s} class needs a docstring".format(
+                                cls.__name__))
+
+    def test_codec_func_docstrings(self):
+        """Test for the presence of docstrings in Codec methods"""
+        for func in self.codec_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestCodec(unittest.TestCase):
+    """Test the snapshot codecs"""
+    records = {"State.1": {"id": "1", "name": "Kansas",
+                           "__class__": "State"},
+               "Place.2": {"id": "2", "amenity_ids": ["a", "b"],
+                           "latitude": 1.5, "description": None,
+                           "max_guest": 3, "__class__": "Place"},
+               "State.3": {"id": "3", "name": "Iowa",
+                           "__class__": "State"}}
+
+    def tearDown(self):
+        """Remove the converted files"""
+        for path in ["test_codec.json", "test_codec.bin"]:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_round_trip(self):
+        """Test that every codec decodes what it encoded"""
+        for name, cdc in codec.codecs.items():
+            with self.subTest(name=name):
+                data = cdc.dumps(self.records)
+                self.assertIs(codec.detect(data), cdc)
+                self.assertEqual(cdc.loads(data), self.records)
+
+    def test_iterload(self):
+        """Test that records stream out of a file in small chunks"""
+        for text in [json.dumps(self.records), json.dumps({}),
+                     json.dumps(self.records, indent=4)]:
+            with self.subTest(text=text):
+                f = io.BytesIO(text.encode("utf-8"))
+                self.assertEqual(dict(JSONCodec().iterload(f, 3)),
+                                 json.loads(text))
+        f = io.BytesIO(BinaryCodec().dumps(self.records))
+        self.assertEqual(dict(BinaryCodec().iterload(f)), self.records)
+        with self.assertRaises(ValueError):
+            list(JSONCodec().iterload(io.BytesIO(b'{"State.1": {}'), 3))
+
+    def test_binary_is_smaller(self):
+        """Test that the binary codec stores field names once per group"""
+        records = {"State." + str(i): {"id": str(i), "name": "Kansas",
+                                       "__class__": "State"}
+                   for i in range(100)}
+        self.assertLess(len(BinaryCodec().dumps(records)),
+                        len(JSONCodec().dumps(records)) / 2)
+
+    def test_native_dates(self):
+        """Test that the binary codec stores dates natively and still reads
+        the ISO strings of version 1"""
+        created = datetime(2017, 3, 25, 2, 17, 6, 123456)
+        records = {"State.1": {"id": "1", "created_at": created,
+                               "updated_at": "2017-03-25T02:17:06.000001",
+                               "__class__": "State"}}
+        loaded = BinaryCodec().loads(BinaryCodec().dumps(records))
+        self.assertEqual(loaded["State.1"]["created_at"], created)
+        self.assertEqual(loaded["State.1"]["updated_at"],
+                         datetime(2017, 3, 25, 2, 17, 6, 1))
+        self.assertEqual(json.loads(JSONCodec().dumps(loaded)),
+                         {"State.1": {"id": "1", "__class__": "State",
+                                      "created_at":
+                                      "2017-03-25T02:17:06.123456",
+                                      "updated_at":
+                                      "2017-03-25T02:17:06.000001"}})
+        records = {"State.2": {"id": "2", "created_at": None},
+                   "State.3": {"id": "3", "created_at": datetime(1900, 1, 1)}}
+        data = BinaryCodec().dumps(records)
+        self.assertEqual(BinaryCodec().loads(data), records)
+        (fields, rows, dates), = marshal.loads(data[8:])
+        self.assertEqual(rows, [("State.2", "2", None),
+                                ("State.3", "3", None)])
+        self.assertEqual(dates, {2: struct.pack(
+            "<2q", -1 << 63, -2208988800 * 10 ** 6)})
+        fields = ("id", "created_at")
+        old = BinaryCodec.header.pack(b"HBNB", 1, 4) + marshal.dumps(
+            [(fields, [("State.1", "1", "2017-03-25T02:17:06.123456")])])
+        self.assertEqual(BinaryCodec().loads(old),
+                         {"State.1": {"id": "1", "created_at":
+                                      "2017-03-25T02:17:06.123456"}})
+
+    def test_binary_version(self):
+        """Test that an unknown format version is rejected"""
+        data = bytearray(BinaryCodec().dumps(self.records))
+        data[4] = 99
+        with self.assertRaises(ValueError):
+            BinaryCodec().loads(bytes(data))
+
+    def test_convert(self):
+        """Test conversion from file.json to binary and back"""
+        with open("test_codec.json", "w") as f:
+            json.dump(self.records, f)
+        codec.convert("test_codec.json", "test_codec.bin")
+        with open("test_codec.bin", "rb") as f:
+            self.assertEqual(BinaryCodec().loads(f.read()), self.records)
+        os.remove("test_codec.json")
+        codec.convert("test_codec.bin", "test_codec.json")
+        with open("test_codec.json", "r") as f:
+            self.assertEqual(json.load(f), self.records)
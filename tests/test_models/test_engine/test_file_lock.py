@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Contains the TestFileLockDocs and TestFileLock classes
+"""
+
+import fcntl
+import inspect
+from models.engine import file_lock
+import os
+import pep8
+import unittest
+FileLock = file_lock.FileLock
+
+
+class TestFileLockDocs(unittest.TestCase):
+    """Tests to check the documentation and style of FileLock class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.file_lock_f = inspect.getmembers(FileLock, inspect.isfunction)
+
+    def test_pep8_conformance_file_lock(self):
+        """Test that models/engine/file_lock.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/file_lock.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_file_lock(self):
+        """Test tests/test_models/test_engine/test_file_lock.py for PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_file_lock.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_file_lock_module_docstring(self):
+        """Test for the file_lock.py module docstring"""
+        self.assertIsNot(file_lock.__doc__, None,
+                         "file_lock.py needs a docstring")
+        self.assertTrue(len(file_lock.__doc__) >= 1,
+                        "file_lock.py needs a docstring")
+
+    def test_file_lock_class_docstring(self):
+        """Test for the FileLock class docstring"""
+        self.assertIsNot(FileLock.__doc__, None,
+                         "FileLock class needs a docstring")
+        self.assertTrue(len(FileLock.__doc__) >= 1,
+                        "FileLock class needs a docstring")
+
+    def test_file_lock_func_docstrings(self):
+        """Test for the presence of docstrings in FileLock methods"""
+        for func in self.file_lock_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestFileLock(unittest.TestCase):
+    """Test the FileLock class"""
+    path = "test_file_lock.lock"
+
+    def tearDown(self):
+        """Remove the lock file"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def held(self):
+        """returns True if another open file cannot take the lock"""
+        with open(self.path, 'a') as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return True
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return False
+
+    def test_exclusive(self):
+        """Test that the lock is held inside the context only"""
+        lock = FileLock(self.path)
+        with lock.exclusive():
+            self.assertTrue(self.held())
+        self.assertFalse(self.held())
+
+    def test_reentrant(self):
+        """Test that nested locks do not deadlock or release early"""
+        lock = FileLock(self.path)
+        with lock.exclusive():
+            with lock.shared():
+                pass
+            with lock.exclusive():
+                pass
+            self.assertTrue(self.held())
+        self.assertFalse(self.held())
@@ -7,6 +7,10 @@ from datetime import datetime
 import inspect
 import models
 from models.engine import file_storage
+from models.engine.file_lock import FileLock
+from models.engine.journal import Journal
+from models.engine.record_file import RecordFile
+from models.engine.snapshot import Snapshot
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
@@ -17,6 +21,10 @@ from models.user import User
 import json
 import os
 import pep8
+import shutil
+import subprocess
+import sys
+import threading
 import unittest
 FileStorage = file_storage.FileStorage
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
@@ -128,6 +136,25 @@ class TestFileStorage(unittest.TestCase):
         new_user = User()
         new_user.save()
         self.assertIs(storage.get("User", new_user.id), new_user)
+        self.assertIs(storage.get(User, new_user.id), new_user)
+        self.assertIs(storage.get(User, new_user.id,
+                                  profile="places_search"), new_user)
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_get_many(self):
+        """Test that get_many returns the objects found, by id"""
+        storage = FileStorage()
+        states = [State(name="Iowa"), State(name="Ohio")]
+        storage.new_many(states)
+        try:
+            ids = [states[0].id, states[1].id, "blah", None]
+            self.assertEqual(storage.get_many(State, ids),
+                             {states[0].id: states[0],
+                              states[1].id: states[1]})
+            self.assertEqual(storage.get_many("Blah", ids), {})
+        finally:
+            storage.delete_many(states)
 
     @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
                      "not testing file storage")
@@ -141,3 +168,553 @@ class TestFileStorage(unittest.TestCase):
         new_state.save()
         self.assertEqual(storage.count(), initial_length + 1)
         self.assertEqual(storage.count("State"), state_len + 1)
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_journal_mode(self):
+        """Test that journaled saves append records that reload replays"""
+        storage = FileStorage()
+        save = (FileStorage._FileStorage__objects,
+                FileStorage._FileStorage__journal)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__journal = Journal("test_file.json.log")
+        try:
+            storage.compact()
+            state = State(name="California")
+            city = City(name="Fremont", state_id=state.id)
+            storage.new(state)
+            storage.new(city)
+            storage.save()
+            with open("file.json", "r") as f:
+                self.assertEqual(json.load(f), {})
+            storage.delete(city)
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(list(storage.all().keys()),
+                             ["State." + state.id])
+            self.assertEqual(storage.all()["State." + state.id].name,
+                             "California")
+            storage.all()["State." + state.id].name = "Oregon"
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(storage.all()["State." + state.id].name,
+                             "Oregon")
+            storage.compact()
+            self.assertEqual(FileStorage._FileStorage__journal.size(), 0)
+            with open("file.json", "r") as f:
+                self.assertIn("State." + state.id, json.load(f))
+        finally:
+            os.remove("test_file.json.log")
+            FileStorage._FileStorage__objects = save[0]
+            FileStorage._FileStorage__journal = save[1]
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_close_applies_only_changes(self):
+        """Test that close skips unchanged files and rebuilds only the
+        records that changed on disk"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            first = State(name="Nevada")
+            second = State(name="Utah")
+            third = State(name="Iowa")
+            storage.new(first)
+            storage.new(second)
+            storage.new(third)
+            storage.save()
+            storage.close()
+            self.assertIs(storage.all()["State." + first.id], first)
+            third.name = "Ohio"
+            with open("file.json", "r") as f:
+                jo = json.load(f)
+            jo["State." + second.id]["name"] = "Arizona"
+            jo["State." + second.id]["updated_at"] = \
+                datetime(2020, 1, 1).strftime("%Y-%m-%dT%H:%M:%S.%f")
+            del jo["State." + first.id]
+            with open("file.json", "w") as f:
+                json.dump(jo, f)
+            storage.close()
+            self.assertNotIn("State." + first.id, storage.all())
+            self.assertEqual(storage.all()["State." + second.id].name,
+                             "Arizona")
+            self.assertIs(storage.all()["State." + third.id], third)
+            self.assertEqual(third.name, "Ohio")
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_close_skips_corrupt_file(self):
+        """Test that close reads a corrupt file once, and save rewrites it"""
+        storage = FileStorage()
+        snapshot = Snapshot("test_file.json")
+        save = (FileStorage._FileStorage__objects,
+                FileStorage._FileStorage__snapshot,
+                FileStorage._FileStorage__journal)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__snapshot = snapshot
+        FileStorage._FileStorage__journal = None
+        reads = []
+        iter_read = snapshot.iter_read
+        snapshot.iter_read = lambda name=None: reads.append(name) or \
+            iter_read(name)
+        try:
+            state = State(name="Idaho")
+            storage.new(state)
+            storage.save()
+            with open("test_file.json", "w") as f:
+                f.write('{"State.1": {"__cl')
+            storage.close()
+            storage.close()
+            self.assertEqual(reads, [None])
+            self.assertIs(storage.all()["State." + state.id], state)
+            storage.save()
+            with open("test_file.json", "r") as f:
+                self.assertIn("State." + state.id, json.load(f))
+        finally:
+            os.remove("test_file.json")
+            FileStorage._FileStorage__objects = save[0]
+            FileStorage._FileStorage__snapshot = save[1]
+            FileStorage._FileStorage__journal = save[2]
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_all_by_class_view(self):
+        """Test that all(cls) is a read-only view kept in step with
+        new and delete, and that count accepts a class"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            state = State()
+            storage.new(state)
+            storage.new(City())
+            states = storage.all(State)
+            self.assertEqual(list(states.keys()), ["State." + state.id])
+            self.assertEqual(dict(states), dict(storage.all("State")))
+            with self.assertRaises(TypeError):
+                states["State.1"] = state
+            self.assertEqual(storage.count(State), 1)
+            self.assertEqual(storage.count("City"), 1)
+            storage.delete(state)
+            self.assertEqual(len(states), 0)
+            self.assertEqual(storage.count(State), 0)
+            FileStorage._FileStorage__objects = {"State." + state.id: state}
+            self.assertEqual(storage.count(State), 1)
+            self.assertEqual(storage.count(City), 0)
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_related(self):
+        """Test that relationship getters read the reference indexes"""
+        storage = models.storage
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            state = State(name="Oregon")
+            city = City(name="Salem", state_id=state.id)
+            user = User()
+            amenity = Amenity(name="Wifi")
+            place = Place(city_id=city.id, user_id=user.id,
+                          amenity_ids=[amenity.id])
+            review = Review(place_id=place.id, user_id=user.id)
+            for obj in [state, city, user, amenity, place, review]:
+                storage.new(obj)
+            storage.count(Review)
+            self.assertIsNone(FileStorage._FileStorage__refs)
+            self.assertEqual(state.cities, [city])
+            self.assertIsNotNone(FileStorage._FileStorage__refs)
+            self.assertEqual(city.places, [place])
+            self.assertEqual(place.reviews, [review])
+            self.assertEqual(place.amenities, [amenity])
+            self.assertEqual(amenity.place_amenities, [place])
+            self.assertEqual(user.places, [place])
+            self.assertEqual(user.reviews, [review])
+            other = State(name="Idaho")
+            city.state_id = other.id
+            storage.new(city)
+            self.assertEqual(state.cities, [])
+            self.assertEqual(other.cities, [city])
+            review.place_id = "elsewhere"
+            self.assertEqual(place.reviews, [])
+            review.place_id = place.id
+            self.assertEqual(place.reviews, [review])
+            place.amenity_ids = []
+            self.assertEqual(amenity.place_amenities, [])
+            storage.delete(review)
+            self.assertEqual(place.reviews, [])
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_sharded_snapshot(self):
+        """Test that a sharded snapshot loads classes on first use and only
+        rewrites the files of changed classes"""
+        storage = FileStorage()
+        save = (FileStorage._FileStorage__objects,
+                FileStorage._FileStorage__snapshot,
+                FileStorage._FileStorage__loaded)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__snapshot = Snapshot("test_shards", True)
+        FileStorage._FileStorage__loaded = set()
+        try:
+            state = State(name="Texas")
+            amenity = Amenity(name="Pool")
+            storage.new(state)
+            storage.new(amenity)
+            storage.save()
+            self.assertEqual(sorted(os.listdir("test_shards")),
+                             ["Amenity.json", "State.json"])
+            amenity_sig = os.stat("test_shards/Amenity.json").st_mtime_ns
+            storage.new(State(name="Ohio"))
+            storage.save()
+            self.assertEqual(os.stat("test_shards/Amenity.json").st_mtime_ns,
+                             amenity_sig)
+            FileStorage._FileStorage__objects = {}
+            FileStorage._FileStorage__loaded = set()
+            storage.reload()
+            self.assertEqual(FileStorage._FileStorage__objects, {})
+            self.assertEqual(storage.get("State", state.id).name, "Texas")
+            self.assertEqual(storage.count("State"), 2)
+            self.assertNotIn("Amenity." + amenity.id,
+                             FileStorage._FileStorage__objects)
+            self.assertEqual(storage.count(), 3)
+        finally:
+            shutil.rmtree("test_shards")
+            FileStorage._FileStorage__objects = save[0]
+            FileStorage._FileStorage__snapshot = save[1]
+            FileStorage._FileStorage__loaded = save[2]
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_binary_snapshot(self):
+        """Test that a binary snapshot reloads objects with their dates"""
+        storage = FileStorage()
+        save = (FileStorage._FileStorage__objects,
+                FileStorage._FileStorage__snapshot,
+                FileStorage._FileStorage__journal)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__snapshot = Snapshot("test_file.bin",
+                                                      codec="binary")
+        FileStorage._FileStorage__journal = None
+        try:
+            state = State(name="Utah")
+            storage.new(state)
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            loaded = storage.get(State, state.id)
+            self.assertIsNot(loaded, state)
+            self.assertEqual(loaded.created_at, state.created_at)
+            self.assertEqual(loaded.updated_at, state.updated_at)
+            self.assertFalse(loaded.dirty)
+            self.assertEqual(loaded.to_dict(), state.to_dict())
+        finally:
+            os.remove("test_file.bin")
+            FileStorage._FileStorage__objects = save[0]
+            FileStorage._FileStorage__snapshot = save[1]
+            FileStorage._FileStorage__journal = save[2]
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_indexed_records(self):
+        """Test that an indexed snapshot only decodes the objects used"""
+        storage = FileStorage()
+        save = (FileStorage._FileStorage__objects,
+                FileStorage._FileStorage__records,
+                FileStorage._FileStorage__loaded)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__records = RecordFile("test_file.rec")
+        FileStorage._FileStorage__loaded = set()
+        try:
+            states = [State(name=str(i)) for i in range(5)]
+            city = City(name="Dover", state_id=states[0].id)
+            for obj in states + [city]:
+                storage.new(obj)
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            objects = FileStorage._FileStorage__objects
+            self.assertEqual(objects, {})
+            self.assertEqual(storage.count("State"), 5)
+            self.assertEqual(storage.count(), 6)
+            state = storage.get("State", states[1].id)
+            self.assertEqual(state.name, "1")
+            self.assertEqual(list(objects.keys()), ["State." + state.id])
+            view = storage.all(State)
+            self.assertEqual(sorted(view.keys()),
+                             sorted("State." + s.id for s in states))
+            self.assertEqual(len(objects), 1)
+            self.assertEqual(sorted(s.name for s in view.values()),
+                             ["0", "1", "2", "3", "4"])
+            storage.delete(state)
+            self.assertEqual(len(view), 4)
+            self.assertEqual(storage.count(), 5)
+            new_state = State(name="5")
+            storage.new(new_state)
+            self.assertIn("State." + new_state.id, view)
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(storage.count("State"), 5)
+            self.assertEqual(storage.get("State", states[0].id).cities[0].name,
+                             "Dover")
+        finally:
+            os.remove("test_file.rec")
+            FileStorage._FileStorage__objects = save[0]
+            FileStorage._FileStorage__records = save[1]
+            FileStorage._FileStorage__loaded = save[2]
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_iter(self):
+        """Test that iter yields the objects of a class in batches"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            states = [State(name=str(i)) for i in range(5)]
+            city = City(name="Dover", state_id=states[0].id)
+            storage.new_many(states[:1] + [city] + states[1:])
+            self.assertEqual(list(storage.iter(State, batch_size=2)),
+                             states)
+            self.assertEqual(list(storage.iter("City")), [city])
+            self.assertEqual(list(storage.iter(batch_size=4)),
+                             states[:1] + [city] + states[1:])
+            self.assertEqual(list(storage.iter("Blah")), [])
+            objs = storage.iter(State, batch_size=2)
+            next(objs)
+            storage.delete(states[4])
+            self.assertEqual(list(objs), states[1:4])
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_iter_indexed(self):
+        """Test that iter decodes indexed records without keeping them"""
+        storage = FileStorage()
+        save = (FileStorage._FileStorage__objects,
+                FileStorage._FileStorage__records,
+                FileStorage._FileStorage__loaded)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__records = RecordFile("test_file.rec")
+        FileStorage._FileStorage__loaded = set()
+        try:
+            states = [State(name=str(i)) for i in range(5)]
+            storage.new_many(states)
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            kept = storage.get("State", states[0].id)
+            names = [s.name for s in storage.iter(State, batch_size=2)]
+            self.assertEqual(sorted(names), ["0", "1", "2", "3", "4"])
+            self.assertEqual(list(FileStorage._FileStorage__objects),
+                             ["State." + kept.id])
+            self.assertIn(kept, list(storage.iter(State)))
+        finally:
+            os.remove("test_file.rec")
+            FileStorage._FileStorage__objects = save[0]
+            FileStorage._FileStorage__records = save[1]
+            FileStorage._FileStorage__loaded = save[2]
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_reads_take_lock(self):
+        """Test that get, all, iter and related wait for a writer holding
+        the lock"""
+        storage = FileStorage()
+        state = State(name="Utah")
+        storage.new(state)
+        reads = [lambda: storage.get(State, state.id),
+                 lambda: storage.all(State),
+                 lambda: list(storage.iter(State)),
+                 lambda: storage.related(City, "state_id", state.id)]
+        try:
+            for read in reads:
+                done = threading.Event()
+                reader = threading.Thread(
+                    target=lambda: (read(), done.set()))
+                with FileStorage._FileStorage__lock:
+                    reader.start()
+                    self.assertFalse(done.wait(0.05))
+                reader.join(5)
+                self.assertTrue(done.is_set())
+        finally:
+            storage.delete(state)
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_new_many(self):
+        """Test that new_many registers several objects at once"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            state = State(name="Ohio")
+            cities = City.from_dicts({"name": str(i), "state_id": state.id}
+                                     for i in range(3))
+            storage.new_many([state] + cities)
+            self.assertEqual(len(storage.all()), 4)
+            self.assertEqual(sorted(c.name for c in state.cities),
+                             ["0", "1", "2"])
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_update_delete_many(self):
+        """Test that update_many and delete_many handle several objects,
+        chunk by chunk"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            states = [State(name=str(i)) for i in range(5)]
+            storage.new_many(states, chunk_size=2)
+            for state in states:
+                state.clean()
+                state.name = "Ohio"
+            before = states[0].updated_at
+            storage.update_many(states, chunk_size=2)
+            self.assertGreater(states[0].updated_at, before)
+            self.assertEqual(states[0].updated_at, states[4].updated_at)
+            self.assertTrue(states[0].dirty)
+            storage.delete_many(states[1:], chunk_size=2)
+            self.assertEqual(list(storage.all(State).values()), states[:1])
+            self.assertEqual(storage.count(State), 1)
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_dirty_tracking(self):
+        """Test that save only writes when objects changed"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            state = State(name="Utah")
+            storage.new(state)
+            storage.save()
+            self.assertFalse(state.dirty)
+            mtime = os.stat("file.json").st_mtime_ns
+            storage.new(state)
+            storage.save()
+            self.assertEqual(os.stat("file.json").st_mtime_ns, mtime)
+            state.name = "Nevada"
+            storage.save()
+            with open("file.json", "r") as f:
+                self.assertEqual(json.load(f)["State." + state.id]["name"],
+                                 "Nevada")
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertFalse(storage.all(State)["State." + state.id].dirty)
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_reload_progress(self):
+        """Test that reload reports its progress and statistics"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__progress_every = 2
+        reports = []
+        try:
+            for i in range(5):
+                storage.new(State(name="State" + str(i)))
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload(progress=reports.append)
+            self.assertEqual(len(storage.all(State)), 5)
+            self.assertEqual([r["records"] for r in reports], [2, 4])
+            stats = storage.stats()
+            self.assertEqual(stats["objects"], 5)
+            self.assertEqual(stats["load"]["records"], 5)
+            self.assertEqual(stats["load"]["bytes"],
+                             os.path.getsize("file.json"))
+            self.assertIn("seconds", stats["load"])
+            self.assertIn("bytes_saved", stats["interned"])
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__progress_every = 10000
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_group_commit(self):
+        """Test that saves within the commit window are written by flush"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__commit_window = 60
+        try:
+            storage.save()
+            storage.flush()
+            state = State(name="Maine")
+            storage.new(state)
+            storage.save()
+            storage.save()
+            with open("file.json", "r") as f:
+                self.assertEqual(json.load(f), {})
+            storage.flush()
+            with open("file.json", "r") as f:
+                self.assertIn("State." + state.id, json.load(f))
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__commit_window = 0
+            FileStorage._FileStorage__committer = None
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "not testing file storage")
+    def test_shared_between_processes(self):
+        """Test that processes sharing the files see each other's saves"""
+        storage = FileStorage()
+        save = (FileStorage._FileStorage__objects,
+                FileStorage._FileStorage__journal,
+                FileStorage._FileStorage__shared)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__journal = Journal("file.json.log")
+        FileStorage._FileStorage__shared = FileLock("file.json.lock")
+        env = dict(os.environ, HBNB_FILE_SHARED="1")
+        for name in ["HBNB_FILE_JOURNAL", "HBNB_FILE_SHARDS",
+                     "HBNB_FILE_FORMAT", "HBNB_FILE_COMMIT_WINDOW"]:
+            env.pop(name, None)
+
+        def child(code):
+            """runs code in another process sharing the files"""
+            return subprocess.run([sys.executable, "-c",
+                                   "import models\n" + code],
+                                  env=env, stdout=subprocess.PIPE,
+                                  check=True).stdout.decode().strip()
+        try:
+            storage.compact()
+            mine = State(name="Parent")
+            storage.new(mine)
+            storage.save()
+            theirs = child("from models.state import State\n"
+                           "s = State(name='Child')\n"
+                           "s.save()\n"
+                           "print(s.id)")
+            self.assertNotIn("State." + theirs, storage.all())
+            storage.close()
+            self.assertEqual(storage.all()["State." + theirs].name, "Child")
+            self.assertIs(storage.all()["State." + mine.id], mine)
+            storage.new(State(name="Parent 2"))
+            storage.save()
+            self.assertEqual(child("print(models.storage.count('State'))"),
+                             "3")
+        finally:
+            os.remove("file.json.log")
+            os.remove("file.json.lock")
+            FileStorage._FileStorage__objects = save[0]
+            FileStorage._FileStorage__journal = save[1]
+            FileStorage._FileStorage__shared = save[2]
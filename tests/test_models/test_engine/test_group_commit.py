@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""
+Contains the TestGroupCommitDocs and TestGroupCommit classes
+"""
+
+import inspect
+from models.engine import group_commit
+import pep8
+import time
+import unittest
+GroupCommit = group_commit.GroupCommit
+
+
+class TestGroupCommitDocs(unittest.TestCase):
+    """Tests to check the documentation and style of GroupCommit class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.group_commit_f = inspect.getmembers(GroupCommit,
+                                                inspect.isfunction)
+
+    def test_pep8_conformance_group_commit(self):
+        """Test that models/engine/group_commit.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/group_commit.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_group_commit(self):
+        """Test tests/test_models/test_engine/test_group_commit.py for PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_group_commit.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_group_commit_module_docstring(self):
+        """Test for the group_commit.py module docstring"""
+        self.assertIsNot(group_commit.__doc__, None,
+                         "group_commit.py needs a docstring")
+        self.assertTrue(len(group_commit.__doc__) >= 1,
+                        "group_commit.py needs a docstring")
+
+    def test_group_commit_class_docstring(self):
+        """Test for the GroupCommit class docstring"""
+        self.assertIsNot(GroupCommit.__doc__, None,
+                         "GroupCommit class needs a docstring")
+        self.assertTrue(len(GroupCommit.__doc__) >= 1,
+                        "GroupCommit class needs a docstring")
+
+    def test_group_commit_func_docstrings(self):
+        """Test for the presence of docstrings in GroupCommit methods"""
+        for func in self.group_commit_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestGroupCommit(unittest.TestCase):
+    """Test the GroupCommit class"""
+
+    def test_coalesce(self):
+        """Test that requests made within the window share one flush"""
+        calls = []
+        writer = GroupCommit(lambda: calls.append(1), 0.05)
+        for i in range(20):
+            writer.request()
+        self.assertEqual(calls, [])
+        time.sleep(0.2)
+        self.assertEqual(calls, [1])
+        self.assertEqual(writer.requests, 20)
+        self.assertEqual(writer.flushes, 1)
+
+    def test_barrier(self):
+        """Test that barrier flushes at once, and only when needed"""
+        calls = []
+        writer = GroupCommit(lambda: calls.append(1), 10)
+        writer.barrier()
+        self.assertEqual(calls, [])
+        writer.request()
+        writer.barrier()
+        self.assertEqual(calls, [1])
+        writer.barrier()
+        self.assertEqual(calls, [1])
+
+    def test_error(self):
+        """Test that a failed background flush is reported by barrier"""
+        def flush():
+            """fails"""
+            raise OSError("disk full")
+        writer = GroupCommit(flush, 0.01)
+        writer.request()
+        time.sleep(0.1)
+        with self.assertRaises(OSError):
+            writer.barrier()
+        writer.barrier()
@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""
+Contains the TestJournalDocs and TestJournal classes
+"""
+
+import inspect
+from models.engine import journal
+import os
+import pep8
+import unittest
+Journal = journal.Journal
+
+
+class TestJournalDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Journal class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.journal_f = inspect.getmembers(Journal, inspect.isfunction)
+
+    def test_pep8_conformance_journal(self):
+        """Test that models/engine/journal.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/journal.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_journal(self):
+        """Test tests/test_models/test_engine/test_journal.py for PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_journal.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_journal_module_docstring(self):
+        """Test for the journal.py module docstring"""
+        self.assertIsNot(journal.__doc__, None,
+                         "journal.py needs a docstring")
+        self.assertTrue(len(journal.__doc__) >= 1,
+                        "journal.py needs a docstring")
+
+    def test_journal_class_docstring(self):
+        """Test for the Journal class docstring"""
+        self.assertIsNot(Journal.__doc__, None,
+                         "Journal class needs a docstring")
+        self.assertTrue(len(Journal.__doc__) >= 1,
+                        "Journal class needs a docstring")
+
+    def test_journal_func_docstrings(self):
+        """Test for the presence of docstrings in Journal methods"""
+        for func in self.journal_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestJournal(unittest.TestCase):
+    """Test the Journal class"""
+    path = "test_journal.log"
+
+    def tearDown(self):
+        """Remove the log file"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_append_replay(self):
+        """Test that appended records are replayed in order"""
+        log = Journal(self.path)
+        log.append([("State.1", {"name": "a"}), ("State.2", None)])
+        log.append([("State.1", {"name": "b"})])
+        self.assertEqual(list(log.replay()), [("State.1", {"name": "a"}),
+                                              ("State.2", None),
+                                              ("State.1", {"name": "b"})])
+
+    def test_replay_missing_file(self):
+        """Test that a missing log replays nothing"""
+        self.assertEqual(list(Journal(self.path).replay()), [])
+
+    def test_replay_torn_tail(self):
+        """Test that replay stops at a partially written last line"""
+        log = Journal(self.path)
+        log.append([("State.1", {"name": "a"})])
+        with open(self.path, 'a') as f:
+            f.write('{"key": "State.2", "ob')
+        self.assertEqual(list(log.replay()), [("State.1", {"name": "a"})])
+
+    def test_size_truncate(self):
+        """Test that truncate empties the log"""
+        log = Journal(self.path)
+        self.assertEqual(log.size(), 0)
+        log.append([("State.1", None)])
+        self.assertTrue(log.size() > 0)
+        log.truncate()
+        self.assertEqual(log.size(), 0)
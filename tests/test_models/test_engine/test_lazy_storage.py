@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+"""
+Contains the TestLazyStorageDocs and TestLazyStorage classes
+"""
+
+import inspect
+from models.engine import lazy_storage
+import os
+import pep8
+import subprocess
+import sys
+import unittest
+LazyStorage = lazy_storage.LazyStorage
+
+
+class TestLazyStorageDocs(unittest.TestCase):
+    """Tests to check the documentation and style of LazyStorage class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.lazy_storage_f = inspect.getmembers(LazyStorage,
+                                                inspect.isfunction)
+
+    def test_pep8_conformance_lazy_storage(self):
+        """Test that models/engine/lazy_storage.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/lazy_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_lazy_storage(self):
+        """Test tests/test_models/test_engine/test_lazy_storage.py for PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_lazy_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_lazy_storage_module_docstring(self):
+        """Test for the lazy_storage.py module docstring"""
+        self.assertIsNot(lazy_storage.__doc__, None,
+                         "lazy_storage.py needs a docstring")
+        self.assertTrue(len(lazy_storage.__doc__) >= 1,
+                        "lazy_storage.py needs a docstring")
+
+    def test_lazy_storage_class_docstring(self):
+        """Test for the LazyStorage class docstring"""
+        self.assertIsNot(LazyStorage.__doc__, None,
+                         "LazyStorage class needs a docstring")
+        self.assertTrue(len(LazyStorage.__doc__) >= 1,
+                        "LazyStorage class needs a docstring")
+
+    def test_lazy_storage_func_docstrings(self):
+        """Test for the presence of docstrings in LazyStorage methods"""
+        for func in self.lazy_storage_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class Engine:
+    """engine recording its calls"""
+    def __init__(self):
+        """initializes the engine"""
+        self.closed = 0
+
+    def close(self):
+        """counts the calls"""
+        self.closed += 1
+
+
+class TestLazyStorage(unittest.TestCase):
+    """Test the LazyStorage class"""
+
+    def test_created_on_first_use(self):
+        """Test that the engine is only created when first used"""
+        created = []
+
+        def create():
+            """returns a new engine"""
+            created.append(Engine())
+            return created[-1]
+        storage = LazyStorage(create)
+        storage.close()
+        self.assertEqual(created, [])
+        self.assertFalse(storage.loaded())
+        self.assertEqual(storage.closed, 0)
+        self.assertEqual(len(created), 1)
+        storage.close()
+        self.assertEqual(created[0].closed, 1)
+        self.assertIs(storage.engine(), created[0])
+        self.assertEqual(len(created), 1)
+
+    def test_models_import(self):
+        """Test that importing models loads nothing until storage is used"""
+        code = ("import models\n"
+                "print(type(models.storage).__name__)\n"
+                "models.storage.all()\n"
+                "print(type(models.storage).__name__)\n"
+                "print(models.warm_up() is models.storage)")
+        out = subprocess.run([sys.executable, "-c", code],
+                             stdout=subprocess.PIPE, check=True).stdout
+        self.assertEqual(out.decode().split(),
+                         ["LazyStorage", models_engine(), "True"])
+
+
+def models_engine():
+    """returns the class name of the engine models.storage selects"""
+    if os.getenv("HBNB_TYPE_STORAGE") == "db":
+        return "DBStorage"
+    return "FileStorage"
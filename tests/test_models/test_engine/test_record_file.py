@@ -0,0 +1,144 @@
+#!/usr/bin/python3
+"""
+Contains the TestRecordFileDocs and TestRecordFile classes
+"""
+
+import inspect
+from models.engine import record_file
+import os
+import pep8
+import unittest
+RecordFile = record_file.RecordFile
+
+
+class TestRecordFileDocs(unittest.TestCase):
+    """Tests to check the documentation and style of RecordFile class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.record_file_f = inspect.getmembers(RecordFile, inspect.isfunction)
+
+    def test_pep8_conformance_record_file(self):
+        """Test that models/engine/record_file.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/record_file.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_record_file(self):
+        """Test tests/test_models/test_engine/test_record_file.py for PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_record_file.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_record_file_module_docstring(self):
+        """Test for the record_file.py module docstring"""
+        self.assertIsNot(record_file.__doc__, None,
+                         "record_file.py needs a docstring")
+        self.assertTrue(len(record_file.__doc__) >= 1,
+                        "record_file.py needs a docstring")
+
+    def test_record_file_class_docstring(self):
+        """Test for the RecordFile class docstring"""
+        self.assertIsNot(RecordFile.__doc__, None,
+                         "RecordFile class needs a docstring")
+        self.assertTrue(len(RecordFile.__doc__) >= 1,
+                        "RecordFile class needs a docstring")
+
+    def test_record_file_func_docstrings(self):
+        """Test for the presence of docstrings in RecordFile methods"""
+        for func in self.record_file_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestRecordFile(unittest.TestCase):
+    """Test the RecordFile class"""
+    path = "test_record_file.rec"
+
+    def tearDown(self):
+        """Remove the record file"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_missing_file(self):
+        """Test that a missing file opens as an empty one"""
+        records = RecordFile(self.path)
+        records.open()
+        self.assertEqual(len(records), 0)
+        self.assertIs(records.get("State.1"), None)
+        self.assertEqual(list(records.keys()), [])
+
+    def test_write_get(self):
+        """Test that records are looked up and decoded one at a time"""
+        records = RecordFile(self.path)
+        data = {"State.2": {"name": "b"}, "City.1": {"name": "c"},
+                "State.1": {"name": "a"}, "StateX.1": {}}
+        records.write((key, RecordFile.encode(data[key]))
+                      for key in sorted(data))
+        self.assertEqual(len(records), 4)
+        for key, value in data.items():
+            with self.subTest(key=key):
+                self.assertIn(key, records)
+                self.assertEqual(records.get(key), value)
+        self.assertNotIn("State.3", records)
+        self.assertEqual(list(records.keys("State.")),
+                         ["State.1", "State.2"])
+        self.assertEqual(records.count("State."), 2)
+        self.assertEqual(records.count(), 4)
+        self.assertEqual(records.raw("City.1"),
+                         RecordFile.encode({"name": "c"}))
+
+    def test_write_order(self):
+        """Test that records given out of key order are rejected"""
+        records = RecordFile(self.path)
+        with self.assertRaises(ValueError):
+            records.write([("State.2", RecordFile.encode({})),
+                           ("State.1", RecordFile.encode({}))])
+        with self.assertRaises(ValueError):
+            records.write([("State.1", RecordFile.encode({})),
+                           ("State.1", RecordFile.encode({}))])
+
+    def test_long_keys(self):
+        """Test that keys of any length are written and looked up"""
+        records = RecordFile(self.path)
+        keys = ["State." + "a" * 200, "State." + "b" * 3, "State.é" * 20]
+        records.write((key, RecordFile.encode({"id": key}))
+                      for key in sorted(keys))
+        for key in keys:
+            with self.subTest(key=key):
+                self.assertEqual(records.get(key), {"id": key})
+        self.assertEqual(list(records.keys("State.")), sorted(keys))
+
+    def test_version_1(self):
+        """Test that files written with 80-byte keys are still read"""
+        data = RecordFile.encode({"name": "a"})
+        header = RecordFile.header_v1
+        entry = RecordFile.entry_v1
+        with open(self.path, "wb") as f:
+            f.write(header.pack(RecordFile.MAGIC, 1, 1,
+                                header.size + len(data)))
+            f.write(data)
+            f.write(entry.pack(b"State.1", header.size, len(data)))
+        records = RecordFile(self.path)
+        records.open()
+        self.assertEqual(list(records.keys()), ["State.1"])
+        self.assertEqual(records.get("State.1"), {"name": "a"})
+
+    def test_reopen(self):
+        """Test that a new instance reads a written file"""
+        RecordFile(self.path).write([("User.1", RecordFile.encode({}))])
+        records = RecordFile(self.path)
+        records.open()
+        self.assertEqual(list(records.keys()), ["User.1"])
+
+    def test_bad_format(self):
+        """Test that a file of another format is rejected"""
+        with open(self.path, "wb") as f:
+            f.write(b"{}" * 20)
+        with self.assertRaises(ValueError):
+            RecordFile(self.path).open()
@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+"""
+Contains the TestSchemaDocs and TestSchema classes
+"""
+
+import inspect
+import models
+from models.engine import schema
+import os
+import pep8
+import sqlalchemy
+from sqlalchemy import create_engine, text
+import tempfile
+import unittest
+
+
+class TestSchemaDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the schema module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.schema_f = inspect.getmembers(schema, inspect.isfunction)
+
+    def test_pep8_conformance_schema(self):
+        """Test that models/engine/schema.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/schema.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_schema(self):
+        """Test tests/test_models/test_engine/test_schema.py conforms to
+        PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_schema.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_schema_module_docstring(self):
+        """Test for the schema.py module docstring"""
+        self.assertIsNot(schema.__doc__, None,
+                         "schema.py needs a docstring")
+        self.assertTrue(len(schema.__doc__) >= 1,
+                        "schema.py needs a docstring")
+
+    def test_schema_func_docstrings(self):
+        """Test for the presence of docstrings in schema functions"""
+        for func in self.schema_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+@unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+class TestSchema(unittest.TestCase):
+    """Test the schema migrations"""
+
+    def setUp(self):
+        """creates the tables of the models without their indexes in a
+        temporary database"""
+        from models.base_model import Base
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = create_engine("sqlite:///" +
+                                    os.path.join(self.tmp.name, "hbnb.db"))
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.drop(connection)
+
+    def tearDown(self):
+        """removes the temporary database"""
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def test_migrate(self):
+        """Test that migrations are applied once and add the indexes"""
+        self.assertEqual(schema.migrate(self.engine), [1])
+        self.assertEqual(schema.migrate(self.engine), [])
+        with self.engine.connect() as connection:
+            self.assertEqual(schema.applied(connection), {1})
+
+    def test_check(self):
+        """Test that EXPLAIN shows the hot queries using their indexes
+        once migrated"""
+        results = schema.check(self.engine)
+        self.assertFalse(any(ok for index, used, ok in results.values()))
+        schema.migrate(self.engine)
+        results = schema.check(self.engine)
+        self.assertIn("places of a city", results)
+        self.assertTrue(all(ok for index, used, ok in results.values()))
+
+    def test_existing_index(self):
+        """Test that an index of another name on a column, such as the one
+        InnoDB creates for a foreign key, is neither duplicated nor
+        reported as missing"""
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                "CREATE INDEX fk_cities_state ON cities (state_id, name)"))
+        schema.migrate(self.engine)
+        with self.engine.connect() as connection:
+            indexes = schema.indexes_of(sqlalchemy.inspect(connection),
+                                        "cities")
+        self.assertNotIn("ix_cities_state_id", indexes)
+        results = schema.check(self.engine)
+        self.assertEqual(results["cities of a state"][:2],
+                         ("cities.state_id", ["fk_cities_state"]))
+        self.assertTrue(all(ok for index, used, ok in results.values()))
@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+"""
+Contains the TestSnapshotDocs and TestSnapshot classes
+"""
+
+import inspect
+from models.engine import snapshot
+import os
+import pep8
+import shutil
+import unittest
+Snapshot = snapshot.Snapshot
+
+
+class TestSnapshotDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Snapshot class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.snapshot_f = inspect.getmembers(Snapshot, inspect.isfunction)
+
+    def test_pep8_conformance_snapshot(self):
+        """Test that models/engine/snapshot.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/snapshot.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_snapshot(self):
+        """Test tests/test_models/test_engine/test_snapshot.py for PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_snapshot.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_snapshot_module_docstring(self):
+        """Test for the snapshot.py module docstring"""
+        self.assertIsNot(snapshot.__doc__, None,
+                         "snapshot.py needs a docstring")
+        self.assertTrue(len(snapshot.__doc__) >= 1,
+                        "snapshot.py needs a docstring")
+
+    def test_snapshot_class_docstring(self):
+        """Test for the Snapshot class docstring"""
+        self.assertIsNot(Snapshot.__doc__, None,
+                         "Snapshot class needs a docstring")
+        self.assertTrue(len(Snapshot.__doc__) >= 1,
+                        "Snapshot class needs a docstring")
+
+    def test_snapshot_func_docstrings(self):
+        """Test for the presence of docstrings in Snapshot methods"""
+        for func in self.snapshot_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test the Snapshot class"""
+
+    def tearDown(self):
+        """Remove the snapshot files"""
+        if os.path.exists("test_snapshot.json"):
+            os.remove("test_snapshot.json")
+        if os.path.exists("test_snapshot"):
+            shutil.rmtree("test_snapshot")
+
+    def test_whole_file(self):
+        """Test that a whole-file snapshot ignores class names"""
+        snap = Snapshot("test_snapshot.json")
+        self.assertIs(snap.stat(), None)
+        snap.write({"State.1": {"name": "a"}}, "State")
+        self.assertEqual(dict(snap.iter_read("City")),
+                         {"State.1": {"name": "a"}})
+        self.assertIsNot(snap.stat(), None)
+        self.assertFalse(os.path.exists("test_snapshot.json.tmp"))
+
+    def test_iter_read(self):
+        """Test that records are read one at a time"""
+        snap = Snapshot("test_snapshot.json")
+        with self.assertRaises(OSError):
+            list(snap.iter_read())
+        snap.write({"State.1": {"name": "a"}, "City.2": {}})
+        self.assertEqual(list(snap.iter_read()),
+                         [("State.1", {"name": "a"}), ("City.2", {})])
+
+    def test_sharded(self):
+        """Test that a sharded snapshot keeps one file per class"""
+        snap = Snapshot("test_snapshot", sharded=True)
+        snap.write({"State.1": {"name": "a"}}, "State")
+        snap.write({"City.1": {"name": "b"}}, "City")
+        self.assertEqual(sorted(os.listdir("test_snapshot")),
+                         ["City.json", "State.json"])
+        self.assertEqual(dict(snap.iter_read("State")),
+                         {"State.1": {"name": "a"}})
+        with self.assertRaises(OSError):
+            list(snap.iter_read("User"))
+
+    def test_codec(self):
+        """Test that files are read with the codec that wrote them"""
+        Snapshot("test_snapshot.json", codec="binary").write({"State.1": {}})
+        with open("test_snapshot.json", "rb") as f:
+            self.assertEqual(f.read(4), b"HBNB")
+        self.assertEqual(dict(Snapshot("test_snapshot.json").iter_read()),
+                         {"State.1": {}})
+        snap = Snapshot("test_snapshot", sharded=True, codec="binary")
+        self.assertEqual(snap.file_path("State"), "test_snapshot/State.bin")
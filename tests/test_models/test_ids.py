@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+"""
+Contains the TestIdsDocs and TestIds classes
+"""
+
+import inspect
+from models import ids
+import pep8
+import time
+import unittest
+import uuid
+UUID7 = ids.UUID7
+
+
+class TestIdsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the ids module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.ids_f = inspect.getmembers(ids, inspect.isfunction) + \
+            inspect.getmembers(UUID7, inspect.isfunction)
+
+    def test_pep8_conformance_ids(self):
+        """Test that models/ids.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/ids.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_ids(self):
+        """Test that tests/test_models/test_ids.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_ids.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_ids_module_docstring(self):
+        """Test for the ids.py module docstring"""
+        self.assertIsNot(ids.__doc__, None,
+                         "ids.py needs a docstring")
+        self.assertTrue(len(ids.__doc__) >= 1,
+                        "ids.py needs a docstring")
+
+    def test_uuid7_class_docstring(self):
+        """Test for the UUID7 class docstring"""
+        self.assertIsNot(UUID7.__doc__, None,
+                         "UUID7 class needs a docstring")
+        self.assertTrue(len(UUID7.__doc__) >= 1,
+                        "UUID7 class needs a docstring")
+
+    def test_ids_func_docstrings(self):
+        """Test for the presence of docstrings in ids functions"""
+        for func in self.ids_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestIds(unittest.TestCase):
+    """Test the id generators"""
+
+    def test_uuid4(self):
+        """Test that uuid4 ids are random UUID strings"""
+        id = ids.uuid4()
+        self.assertEqual(uuid.UUID(id).version, 4)
+        self.assertNotEqual(id, ids.uuid4())
+
+    def test_uuid7(self):
+        """Test that uuid7 ids are version 7 UUID strings holding the time
+        they were made at"""
+        before = time.time_ns() // 1000000
+        id = UUID7()()
+        value = uuid.UUID(id)
+        self.assertEqual(len(id), 36)
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertGreaterEqual(value.int >> 80, before)
+        self.assertLessEqual(value.int >> 80, time.time_ns() // 1000000)
+
+    def test_uuid7_order(self):
+        """Test that uuid7 ids sort in the order they were made"""
+        generate = UUID7()
+        made = [generate() for i in range(10000)]
+        self.assertEqual(sorted(made), made)
+        self.assertEqual(len(set(made)), len(made))
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""
+Contains the TestInternDocs and TestInternTable classes
+"""
+
+import inspect
+import models
+from models import intern
+from models.place import Place
+from models.review import Review
+import os
+import pep8
+import sys
+import unittest
+InternTable = intern.InternTable
+
+
+class TestInternDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the intern module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.intern_f = inspect.getmembers(InternTable, inspect.isfunction)
+
+    def test_pep8_conformance_intern(self):
+        """Test that models/intern.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/intern.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_intern(self):
+        """Test that tests/test_models/test_intern.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_intern.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_intern_module_docstring(self):
+        """Test for the intern.py module docstring"""
+        self.assertIsNot(intern.__doc__, None,
+                         "intern.py needs a docstring")
+        self.assertTrue(len(intern.__doc__) >= 1,
+                        "intern.py needs a docstring")
+
+    def test_intern_table_class_docstring(self):
+        """Test for the InternTable class docstring"""
+        self.assertIsNot(InternTable.__doc__, None,
+                         "InternTable class needs a docstring")
+        self.assertTrue(len(InternTable.__doc__) >= 1,
+                        "InternTable class needs a docstring")
+
+    def test_intern_table_func_docstrings(self):
+        """Test for the presence of docstrings in InternTable methods"""
+        for func in self.intern_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestInternTable(unittest.TestCase):
+    """Test the InternTable class"""
+
+    def test_intern(self):
+        """Test that equal strings are replaced by one shared copy"""
+        table = InternTable()
+        first = "".join(["city", "-1"])
+        second = "".join(["city", "-1"])
+        self.assertIsNot(first, second)
+        self.assertIs(table.intern(first), first)
+        self.assertIs(table.intern(second), first)
+        self.assertEqual(table.intern(["x", second, 3]), ["x", first, 3])
+        self.assertIs(table.intern([second])[0], first)
+        self.assertIsNone(table.intern(None))
+        third = "".join(["city", "-1"])
+        self.assertIs(InternTable(enabled=False).intern(third), third)
+
+    def test_enabled(self):
+        """Test that ids are only interned in file mode"""
+        self.assertEqual(intern.references.enabled,
+                         models.storage_t != "db")
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     "ids are not interned in db mode")
+    def test_references(self):
+        """Test that models list and intern their reference attributes"""
+        self.assertLessEqual({"city_id", "user_id"}, Place._references)
+        self.assertEqual(Review._references, {"place_id", "user_id"})
+        ids = ["".join(["place", "-2"]) for i in range(4)]
+        reviews = [Review(place_id=ids[0]), Review.from_dicts(
+            [{"place_id": ids[1]}])[0], Review()]
+        reviews[2].place_id = ids[2]
+        self.assertIs(reviews[0].place_id, reviews[1].place_id)
+        self.assertIs(reviews[0].place_id, reviews[2].place_id)
+        if "amenity_ids" in Place._references:
+            place = Place(amenity_ids=[ids[3]])
+            self.assertIs(place.amenity_ids[0], reviews[0].place_id)
+
+    def test_stats(self):
+        """Test that stats reports the bytes saved by shared ids"""
+        table = InternTable()
+        ids = ["".join(["user", "-3"]) for i in range(3)]
+        reviews = [Review(), Review(), Review()]
+        for review, id in zip(reviews, ids):
+            object.__setattr__(review, "user_id", id)
+        stats = table.stats(reviews)
+        self.assertEqual(stats["distinct"], 3)
+        self.assertEqual(stats["bytes_saved"], 0)
+        for review in reviews:
+            object.__setattr__(review, "user_id",
+                               table.intern(review.user_id))
+        stats = table.stats(reviews)
+        self.assertEqual(stats, {"distinct": 1,
+                                 "bytes_saved": 2 * sys.getsizeof(ids[0])})
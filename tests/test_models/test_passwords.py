@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+"""
+Contains the TestPasswordsDocs and TestPasswordHasher classes
+"""
+
+import hashlib
+import inspect
+from models import passwords
+import pep8
+import threading
+import unittest
+from unittest import mock
+PasswordHasher = passwords.PasswordHasher
+
+
+class TestPasswordsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the passwords module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.passwords_f = inspect.getmembers(PasswordHasher,
+                                             inspect.isfunction)
+
+    def test_pep8_conformance_passwords(self):
+        """Test that models/passwords.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/passwords.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_passwords(self):
+        """Test that tests/test_models/test_passwords.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_passwords.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_passwords_module_docstring(self):
+        """Test for the passwords.py module docstring"""
+        self.assertIsNot(passwords.__doc__, None,
+                         "passwords.py needs a docstring")
+        self.assertTrue(len(passwords.__doc__) >= 1,
+                        "passwords.py needs a docstring")
+
+    def test_password_hasher_class_docstring(self):
+        """Test for the PasswordHasher class docstring"""
+        self.assertIsNot(PasswordHasher.__doc__, None,
+                         "PasswordHasher class needs a docstring")
+        self.assertTrue(len(PasswordHasher.__doc__) >= 1,
+                        "PasswordHasher class needs a docstring")
+
+    def test_password_hasher_func_docstrings(self):
+        """Test for the presence of docstrings in PasswordHasher methods"""
+        for func in self.passwords_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestPasswordHasher(unittest.TestCase):
+    """Test the PasswordHasher class"""
+
+    def setUp(self):
+        """creates a cheap hasher"""
+        self.hasher = PasswordHasher(cost=4, workers=2)
+
+    def test_hash(self):
+        """Test that hashes are salted and checked against passwords"""
+        hashed = self.hasher.hash("secret")
+        self.assertTrue(hashed.startswith("scrypt$4$8$1$"))
+        self.assertTrue(self.hasher.is_hash(hashed))
+        self.assertFalse(self.hasher.is_hash("secret"))
+        self.assertNotEqual(hashed, self.hasher.hash("secret"))
+        self.assertTrue(self.hasher.check("secret", hashed))
+        self.assertFalse(self.hasher.check("Secret", hashed))
+        self.assertFalse(self.hasher.check("secret", "secret"))
+        self.assertFalse(self.hasher.outdated(hashed))
+
+    def test_outdated(self):
+        """Test that legacy and cheaper hashes are checked and outdated"""
+        legacy = hashlib.md5(b"secret").hexdigest()
+        self.assertTrue(self.hasher.check("secret", legacy))
+        self.assertFalse(self.hasher.check("guess", legacy))
+        self.assertTrue(self.hasher.outdated(legacy))
+        hashed = self.hasher.hash("secret")
+        self.hasher.cost = 5
+        self.assertTrue(self.hasher.check("secret", hashed))
+        self.assertTrue(self.hasher.outdated(hashed))
+
+    def test_overloaded(self):
+        """Test that hashes beyond the workers and queue are rejected"""
+        hasher = PasswordHasher(cost=4, workers=1, queue=1)
+        release = threading.Event()
+        scrypt = hashlib.scrypt
+
+        def slow(*args, **kwargs):
+            """waits to be released before hashing"""
+            release.wait()
+            return scrypt(*args, **kwargs)
+        with mock.patch("hashlib.scrypt", slow):
+            threads = [threading.Thread(target=hasher.hash, args=("pw",))
+                       for i in range(2)]
+            for thread in threads:
+                thread.start()
+            while hasher.stats()["pending"] < 2:
+                pass
+            with self.assertRaises(passwords.Overloaded):
+                hasher.hash("pw")
+            release.set()
+            for thread in threads:
+                thread.join()
+        self.assertTrue(hasher.check("pw", hasher.hash("pw")))
+        stats = hasher.stats()
+        self.assertEqual(stats["derived"], 4)
+        self.assertEqual(stats["rejected"], 1)
+        self.assertEqual(stats["pending"], 0)
+        self.assertGreater(stats["per_second"], 0)
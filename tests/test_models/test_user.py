@@ -4,12 +4,14 @@ Contains the TestUserDocs classes
 """
 
 from datetime import datetime
+import hashlib
 import inspect
 import models
 from models import user
 from models.base_model import BaseModel
 import pep8
 import unittest
+from unittest import mock
 User = user.User
 
 
@@ -130,3 +132,43 @@ class TestUser(unittest.TestCase):
         user = User()
         string = "[User] ({}) {}".format(user.id, user.__dict__)
         self.assertEqual(string, str(user))
+
+    def test_password_hashed(self):
+        """Test that passwords are stored hashed, and stored hashes as they
+        are"""
+        user = User(password="secret")
+        self.assertTrue(user.password.startswith("scrypt$"))
+        self.assertTrue(user.check_password("secret"))
+        self.assertFalse(user.check_password("guess"))
+        copy, = User.from_dicts([user.to_dict(del_pw=False)], stored=True)
+        self.assertEqual(copy.password, user.password)
+        self.assertTrue(copy.check_password("secret"))
+        copy = User(**user.to_dict(del_pw=False))
+        self.assertNotEqual(copy.password, user.password)
+        user.password = "other"
+        self.assertTrue(user.check_password("other"))
+
+    def test_password_like_hash(self):
+        """Test that passwords looking like hashes are hashed too"""
+        password = "0123456789abcdef0123456789abcdef"
+        user = User(password=password)
+        self.assertTrue(user.password.startswith("scrypt$"))
+        self.assertTrue(user.check_password(password))
+        user.password = "scrypt$4$8$1$c2FsdA==$a2V5"
+        self.assertTrue(user.check_password("scrypt$4$8$1$c2FsdA==$a2V5"))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_password_rehash(self):
+        """Test that checking a legacy md5 password replaces its hash"""
+        legacy = hashlib.md5(b"secret").hexdigest()
+        user, = User.from_dicts([{"password": legacy}], stored=True)
+        self.assertEqual(user.password, legacy)
+        with mock.patch.object(User, "save") as save:
+            self.assertFalse(user.check_password("guess"))
+            self.assertEqual(user.password, legacy)
+            self.assertFalse(user.dirty)
+            self.assertTrue(user.check_password("secret"))
+            self.assertFalse(save.called)
+        self.assertTrue(user.dirty)
+        self.assertTrue(user.password.startswith("scrypt$"))
+        self.assertTrue(user.check_password("secret"))
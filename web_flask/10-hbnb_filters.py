@@ -5,14 +5,14 @@ starts a Flask web application
 
 from flask import Flask, render_template
 from models import *
-from models import storage
+from models import storage, warm_up
 app = Flask(__name__)
 
 
 @app.route('/hbnb_filters', strict_slashes=False)
 def filters():
     """display a HTML page like 6-index.html from static"""
-    states = storage.all("State").values()
+    states = storage.all("State", profile="states_cities").values()
     amenities = storage.all("Amenity").values()
     return render_template('10-hbnb_filters.html', states=states,
                            amenities=amenities)
@@ -24,4 +24,5 @@ def teardown_db(exception):
     storage.close()
 
 if __name__ == '__main__':
+    warm_up()
     app.run(host='0.0.0.0', port='5000')
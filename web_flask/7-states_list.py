@@ -5,7 +5,7 @@ starts a Flask web application
 
 from flask import Flask, render_template
 from models import *
-from models import storage
+from models import storage, warm_up
 app = Flask(__name__)
 
 
@@ -22,4 +22,5 @@ def teardown_db(exception):
     storage.close()
 
 if __name__ == '__main__':
+    warm_up()
     app.run(host='0.0.0.0', port='5000')
@@ -5,14 +5,14 @@ starts a Flask web application
 
 from flask import Flask, render_template
 from models import *
-from models import storage
+from models import storage, warm_up
 app = Flask(__name__)
 
 
 @app.route('/cities_by_states', strict_slashes=False)
 def cities_by_states():
     """display the states and cities listed in alphabetical order"""
-    states = storage.all("State").values()
+    states = storage.all("State", profile="states_cities").values()
     return render_template('8-cities_by_states.html', states=states)
 
 
@@ -22,4 +22,5 @@ def teardown_db(exception):
     storage.close()
 
 if __name__ == '__main__':
+    warm_up()
     app.run(host='0.0.0.0', port='5000')
@@ -5,7 +5,7 @@ starts a Flask web application
 
 from flask import Flask, render_template
 from models import *
-from models import storage
+from models import storage, warm_up
 app = Flask(__name__)
 
 
@@ -13,7 +13,7 @@ app = Flask(__name__)
 @app.route('/states/<state_id>', strict_slashes=False)
 def states(state_id=None):
     """display the states and cities listed in alphabetical order"""
-    states = storage.all("State")
+    states = storage.all("State", profile="states_cities")
     if state_id is not None:
         state_id = 'State.' + state_id
     return render_template('9-states.html', states=states, state_id=state_id)
@@ -25,4 +25,5 @@ def teardown_db(exception):
     storage.close()
 
 if __name__ == '__main__':
+    warm_up()
     app.run(host='0.0.0.0', port='5000')